@@ -17,6 +17,7 @@ Values are displayed and updated on the same lines (no scrolling).
 Changes are highlighted when detected.
 """
 
+import array
 import sys
 import time
 import os
@@ -28,21 +29,152 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from src.driver import GE_SRTP_Driver
 
 
+# Status column lookups. TREND_STATUS is indexed by the sign of
+# (current - previous): 0 = unchanged, 1 = increased, -1 = decreased.
+NO_STATUS = "     "
+TREND_STATUS = ("  =  ", "  ↑  ", "  ↓  ")
+CHANGE_STATUS = ("  =  ", " CHG ")
+
+# State column for a discrete bit, indexed by the bit value
+BIT_STATE = ("OFF", "ON ")
+
+
+def trend_column(current, previous):
+    """
+    Build the up/down/equal status column for a poll in a single pass.
+
+    Args:
+        current: Values from this poll
+        previous: Values from the last poll, or None on the first poll
+
+    Returns:
+        List of status strings, one per value
+    """
+    if previous is None:
+        return [NO_STATUS] * len(current)
+    return [TREND_STATUS[(cur > prev) - (cur < prev)] for cur, prev in zip(current, previous)]
+
+
+def change_column(current, previous):
+    """
+    Build the changed/unchanged status column for a poll of discrete bits.
+
+    Args:
+        current: Bit states from this poll
+        previous: Bit states from the last poll, or None on the first poll
+
+    Returns:
+        List of status strings, one per bit
+    """
+    if previous is None:
+        return [NO_STATUS] * len(current)
+    return [CHANGE_STATUS[cur != prev] for cur, prev in zip(current, previous)]
+
+
+def frame_writer():
+    """
+    Return a function that writes a finished frame straight to stdout.
+
+    On POSIX the encoded frame goes to the stdout file descriptor with
+    os.write(), bypassing the text layer and its locking. Windows consoles
+    get the binary buffer instead, and streams with neither (IDE consoles,
+    redirected sys.stdout) fall back to plain text writes. Pending print()
+    output is flushed first so nothing is reordered.
+    """
+    stream = sys.stdout
+    stream.flush()
+    encoding = getattr(stream, 'encoding', None) or 'utf-8'
+
+    if os.name != 'nt':
+        try:
+            fd = stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            fd = None
+
+        if fd is not None:
+            def emit(text):
+                data = memoryview(text.encode(encoding, 'replace'))
+                while data:
+                    data = data[os.write(fd, data):]
+
+            return emit
+
+    buffer = getattr(stream, 'buffer', None)
+    if buffer is not None:
+        def emit(text):
+            buffer.write(text.encode(encoding, 'replace'))
+            buffer.flush()
+
+        return emit
+
+    def emit(text):
+        stream.write(text)
+        stream.flush()
+
+    return emit
+
+
 def clear_screen():
     """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if os.name == 'nt':
+        # Older Windows consoles may not interpret ANSI escapes
+        os.system('cls')
+    else:
+        # Erase display and home the cursor without spawning a shell
+        sys.stdout.write('\033[2J\033[H')
+        sys.stdout.flush()
+
+
+# Erase from the cursor to the end of the line
+CLEAR_LINE = '\033[K'
+
+def row_templates(address_format, value_format, count):
+    """
+    Build one %-format template per data row with the address columns filled in.
+
+    The index and address never change between polls, so they are formatted
+    once here and each poll only substitutes the value and status columns.
+    """
+    return [
+        CLEAR_LINE + (address_format % (i, i + 1)).replace("%", "%%") + value_format
+        for i in range(count)
+    ]
 
 
-def move_cursor_up(lines):
-    """Move cursor up N lines."""
-    sys.stdout.write(f'\033[{lines}F')
-    sys.stdout.flush()
+def render_rows(row_formats, values, statuses, shown_values=None, shown_statuses=None):
+    """
+    Render the data rows of a frame, skipping rows that are already on screen.
 
+    A row is redrawn when its value or status differs from what the last
+    frame showed. Unchanged rows become a bare newline, which moves the
+    cursor past the line without touching it. With nothing shown yet
+    (shown_values is None) every row is drawn.
 
-def clear_line():
-    """Clear current line."""
-    sys.stdout.write('\033[K')
-    sys.stdout.flush()
+    Args:
+        row_formats: Per-row templates from row_templates()
+        values: Values for this frame
+        statuses: Status strings for this frame
+        shown_values: Values drawn by the last frame, or None
+        shown_statuses: Status strings drawn by the last frame, or None
+
+    Returns:
+        List of strings, one per row
+    """
+    if shown_values is None:
+        return [
+            row_format % (value, status)
+            for row_format, value, status in zip(row_formats, values, statuses)
+        ]
+    return [
+        row_format % (value, status) if value != old_value or status != old_status else "\n"
+        for row_format, value, status, old_value, old_status
+        in zip(row_formats, values, statuses, shown_values, shown_statuses)
+    ]
+
+
+def cursor_up(lines):
+    """Return the escape sequence that moves the cursor up N lines."""
+    return f'\033[{lines}F'
 
 
 def monitor_registers(plc, count=10, interval=1.0):
@@ -64,8 +196,13 @@ def monitor_registers(plc, count=10, interval=1.0):
     print()
 
     previous_values = None
+    previous_statuses = None
     iteration = 0
 
+    # Two preallocated buffers, swapped every poll instead of allocating lists
+    current_values = array.array('h', bytes(2 * count))
+    spare_values = array.array('h', bytes(2 * count))
+
     # Print initial header
     print("Addr | Register | Current Value | Status")
     print("-"*80)
@@ -74,35 +211,44 @@ def monitor_registers(plc, count=10, interval=1.0):
     for i in range(count):
         print()
 
+    # Bind hot-loop lookups to locals once, outside the polling loop
+    read_into = plc.read_register_into
+    sleep = time.sleep
+    clock = time.monotonic_ns
+    interval_ns = round(interval * 1_000_000_000)
+    frame_start = cursor_up(count)
+    row_formats = row_templates(" %3d |   %%R%3d  |", "     %6d    | %s\n", count)
+
+    write = frame_writer()
+
     try:
+        next_poll = clock()
         while True:
             iteration += 1
 
             # Read current values
-            current_values = plc.read_register(0, count=count)
-
-            # Move cursor back up to data area
-            move_cursor_up(count)
-
-            # Update each line
-            for i, value in enumerate(current_values):
-                clear_line()
-
-                status = "     "
-                if previous_values is not None:
-                    if value > previous_values[i]:
-                        status = "  ↑  "  # Increased
-                    elif value < previous_values[i]:
-                        status = "  ↓  "  # Decreased
-                    elif value == previous_values[i]:
-                        status = "  =  "  # No change
+            read_into(current_values, 0, count)
 
-                print(f" {i:3d} |   %R{i+1:3d}  |     {value:6d}    | {status}", flush=True)
+            # Build the whole frame (cursor move + changed rows) and emit it in one write
+            statuses = trend_column(current_values, previous_values)
+            rows = render_rows(
+                row_formats, current_values, statuses, previous_values, previous_statuses
+            )
+            write(frame_start + "".join(rows))
+            previous_statuses = statuses
 
+            # Current buffer becomes the previous one; the old previous is reused
             previous_values = current_values
+            current_values, spare_values = spare_values, current_values
 
-            # Wait before next poll
-            time.sleep(interval)
+            # Wait out the rest of the interval, measured from the poll start,
+            # so read and redraw time does not stretch the cadence
+            next_poll += interval_ns
+            delay_ns = next_poll - clock()
+            if delay_ns > 0:
+                sleep(delay_ns / 1_000_000_000)
+            else:
+                next_poll = clock()  # Fell behind; resync instead of bursting
 
     except KeyboardInterrupt:
         print("\n")
@@ -132,6 +278,8 @@ def monitor_analog_io(plc, ai_count=5, aq_count=5, interval=1.0):
 
     previous_ai = None
     previous_aq = None
+    previous_ai_statuses = None
+    previous_aq_statuses = None
     iteration = 0
 
     # Print headers for inputs
@@ -156,56 +304,67 @@ def monitor_analog_io(plc, ai_count=5, aq_count=5, interval=1.0):
     # Total lines to move cursor up = all data lines + 1 separator line + 3 header lines for outputs
     total_lines = ai_count + 1 + 3 + aq_count
 
+    # Bind hot-loop lookups to locals once, outside the polling loop
+    read_ai = plc.read_analog_input
+    read_aq = plc.read_analog_output
+    sleep = time.sleep
+    clock = time.monotonic_ns
+    interval_ns = round(interval * 1_000_000_000)
+    frame_start = cursor_up(total_lines)
+    ai_formats = row_templates(" %3d | %%AI%3d |", "     %6d    | %s\n", ai_count)
+    aq_formats = row_templates(" %3d | %%AQ%3d |", "     %6d    | %s\n", aq_count)
+
+    # True once the rows on screen match the latest values with no trend arrows
+    settled = False
+
+    write = frame_writer()
+
     try:
+        next_poll = clock()
         while True:
             iteration += 1
 
             # Read current values
-            current_ai = plc.read_analog_input(0, count=ai_count)
-            current_aq = plc.read_analog_output(0, count=aq_count)
-
-            # Move cursor back up to start of data area
-            move_cursor_up(total_lines)
-
-            # Update analog inputs
-            for i, value in enumerate(current_ai):
-                clear_line()
-
-                status = "     "
-                if previous_ai is not None:
-                    if value > previous_ai[i]:
-                        status = "  ↑  "
-                    elif value < previous_ai[i]:
-                        status = "  ↓  "
-                    elif value == previous_ai[i]:
-                        status = "  =  "
-
-                print(f" {i:3d} | %AI{i+1:3d} |     {value:6d}    | {status}", flush=True)
-
-            # Move cursor down past separator and output headers (4 lines total)
-            for _ in range(4):
-                print()
-
-            # Update analog outputs
-            for i, value in enumerate(current_aq):
-                clear_line()
-
-                status = "     "
-                if previous_aq is not None:
-                    if value > previous_aq[i]:
-                        status = "  ↑  "
-                    elif value < previous_aq[i]:
-                        status = "  ↓  "
-                    elif value == previous_aq[i]:
-                        status = "  =  "
-
-                print(f" {i:3d} | %AQ{i+1:3d} |     {value:6d}    | {status}", flush=True)
-
+            current_ai = read_ai(0, count=ai_count)
+            current_aq = read_aq(0, count=aq_count)
+
+            # List equality compares element-wise in C; when nothing changed
+            # and the rows already show "=", there is nothing to redraw
+            unchanged = current_ai == previous_ai and current_aq == previous_aq
+            if not (unchanged and settled):
+                # Build the whole frame and emit it in one write
+                frame = [frame_start]
+
+                # Analog inputs
+                ai_statuses = trend_column(current_ai, previous_ai)
+                frame += render_rows(
+                    ai_formats, current_ai, ai_statuses, previous_ai, previous_ai_statuses
+                )
+
+                # Move cursor down past separator and output headers (4 lines total)
+                frame.append("\n" * 4)
+
+                # Analog outputs
+                aq_statuses = trend_column(current_aq, previous_aq)
+                frame += render_rows(
+                    aq_formats, current_aq, aq_statuses, previous_aq, previous_aq_statuses
+                )
+
+                write("".join(frame))
+                previous_ai_statuses = ai_statuses
+                previous_aq_statuses = aq_statuses
+            settled = unchanged
             previous_ai = current_ai
             previous_aq = current_aq
 
-            # Wait before next poll
-            time.sleep(interval)
+            # Wait out the rest of the interval, measured from the poll start,
+            # so read and redraw time does not stretch the cadence
+            next_poll += interval_ns
+            delay_ns = next_poll - clock()
+            if delay_ns > 0:
+                sleep(delay_ns / 1_000_000_000)
+            else:
+                next_poll = clock()  # Fell behind; resync instead of bursting
 
     except KeyboardInterrupt:
         print("\n")
@@ -234,6 +393,9 @@ def monitor_discrete_io(plc, count=16, interval=1.0):
 
     previous_i = None
     previous_q = None
+    # State and status strings drawn by the last frame
+    shown_i = shown_i_statuses = None
+    shown_q = shown_q_statuses = None
     iteration = 0
 
     # Print headers for inputs
@@ -258,54 +420,57 @@ def monitor_discrete_io(plc, count=16, interval=1.0):
     # Total lines to move cursor up = all data lines + 1 separator line + 3 header lines for outputs
     total_lines = count + 1 + 3 + count
 
+    # Bind hot-loop lookups to locals once, outside the polling loop
+    read_i = plc.read_discrete_input
+    read_q = plc.read_discrete_output
+    sleep = time.sleep
+    clock = time.monotonic_ns
+    interval_ns = round(interval * 1_000_000_000)
+    frame_start = cursor_up(total_lines)
+    i_formats = row_templates(" %3d |  %%I%3d |", "  %s  | %s\n", count)
+    q_formats = row_templates(" %3d |  %%Q%3d |", "  %s  | %s\n", count)
+
+    write = frame_writer()
+
     try:
+        next_poll = clock()
         while True:
             iteration += 1
 
             # Read current values
-            current_i = plc.read_discrete_input(0, count=count, mode='bit')
-            current_q = plc.read_discrete_output(0, count=count, mode='bit')
-
-            # Move cursor back up to start of data area
-            move_cursor_up(total_lines)
+            current_i = read_i(0, count=count, mode='bit')
+            current_q = read_q(0, count=count, mode='bit')
 
-            # Update discrete inputs
-            for i, value in enumerate(current_i):
-                clear_line()
+            # Build the whole frame and emit it in one write
+            frame = [frame_start]
 
-                state = "ON " if value else "OFF"
-                status = "     "
-                if previous_i is not None:
-                    if value != previous_i[i]:
-                        status = " CHG "
-                    else:
-                        status = "  =  "
-
-                print(f" {i:3d} |  %I{i+1:3d} |  {state}  | {status}", flush=True)
+            # Discrete inputs
+            states_i = [BIT_STATE[value] for value in current_i]
+            statuses_i = change_column(current_i, previous_i)
+            frame += render_rows(i_formats, states_i, statuses_i, shown_i, shown_i_statuses)
 
             # Move cursor down past separator and output headers (4 lines total)
-            for _ in range(4):
-                print()
-
-            # Update discrete outputs
-            for i, value in enumerate(current_q):
-                clear_line()
+            frame.append("\n" * 4)
 
-                state = "ON " if value else "OFF"
-                status = "     "
-                if previous_q is not None:
-                    if value != previous_q[i]:
-                        status = " CHG "
-                    else:
-                        status = "  =  "
-
-                print(f" {i:3d} |  %Q{i+1:3d} |  {state}  | {status}", flush=True)
+            # Discrete outputs
+            states_q = [BIT_STATE[value] for value in current_q]
+            statuses_q = change_column(current_q, previous_q)
+            frame += render_rows(q_formats, states_q, statuses_q, shown_q, shown_q_statuses)
 
+            write("".join(frame))
             previous_i = current_i
             previous_q = current_q
-
-            # Wait before next poll
-            time.sleep(interval)
+            shown_i, shown_i_statuses = states_i, statuses_i
+            shown_q, shown_q_statuses = states_q, statuses_q
+
+            # Wait out the rest of the interval, measured from the poll start,
+            # so read and redraw time does not stretch the cadence
+            next_poll += interval_ns
+            delay_ns = next_poll - clock()
+            if delay_ns > 0:
+                sleep(delay_ns / 1_000_000_000)
+            else:
+                next_poll = clock()  # Fell behind; resync instead of bursting
 
     except KeyboardInterrupt:
         print("\n")
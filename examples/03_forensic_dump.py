@@ -19,16 +19,138 @@ Useful for forensic analysis, backup, and troubleshooting.
 import sys
 import os
 import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any
+from itertools import islice
+from typing import Dict, Any, Iterator, Optional, Tuple
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.driver import GE_SRTP_Driver
 
+# orjson is optional; it serializes dump sections several times faster than
+# the stdlib json module, which is used when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def dump_registers(plc: GE_SRTP_Driver, start: int, end: int) -> Dict[str, Any]:
+
+# Number of register batches read at once by dump_registers; the dump's
+# driver opens this many connections so they are read in parallel
+PIPELINE_DEPTH = 4
+
+# Register windows that may be read ahead of the JSON writer
+READ_AHEAD = 2
+
+
+class JSONStreamWriter:
+    """
+    Incrementally write a JSON document to an open binary file.
+
+    Objects are opened and closed explicitly and members are serialized as
+    they are produced, so large dumps never have to be built in memory.
+    The output is formatted the same as json.dump(..., indent=2), UTF-8
+    encoded, and the number of bytes written is tracked as it goes.
+    """
+
+    def __init__(self, f, indent: int = 2):
+        """
+        Args:
+            f: File object opened for writing bytes
+            indent: Spaces per nesting level (default 2)
+        """
+        self.f = f
+        self.indent = indent
+        self.bytes_written = 0
+        # One entry per open object: True until its first member is written
+        self._open = []
+
+    def _write(self, data: bytes) -> None:
+        self.f.write(data)
+        self.bytes_written += len(data)
+
+    def _newline(self, depth: int) -> bytes:
+        return b"\n" + b" " * (self.indent * depth)
+
+    def _begin_member(self, key: str) -> None:
+        separator = b"" if self._open[-1] else b","
+        self._open[-1] = False
+        self._write(separator + self._newline(len(self._open)) + json.dumps(key).encode() + b": ")
+
+    def begin_object(self, key: Optional[str] = None) -> None:
+        """Open a JSON object, as a member named `key` if given."""
+        if key is not None:
+            self._begin_member(key)
+        self._write(b"{")
+        self._open.append(True)
+
+    def write_member(self, key: str, value: Any) -> None:
+        """Serialize one member of the innermost open object."""
+        self._begin_member(key)
+        if orjson is not None and self.indent == 2:
+            data = orjson.dumps(value, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(value, indent=self.indent).encode()
+        self._write(data.replace(b"\n", self._newline(len(self._open))))
+
+    def end_object(self) -> None:
+        """Close the innermost open object."""
+        empty = self._open.pop()
+        self._write(b"}" if empty else self._newline(len(self._open)) + b"}")
+
+
+def iter_registers(plc: GE_SRTP_Driver, start: int, end: int, depth: int = PIPELINE_DEPTH) -> Iterator[Tuple[str, Dict[str, int]]]:
+    """
+    Read a range of registers and yield register map entries in address order.
+
+    The range is read in windows of `depth` batches, each through
+    plc.acquire_all(), which pipelines the batches and spreads them over
+    the driver's connections (a driver created with concurrency=depth
+    reads a whole window in parallel). Reading runs ahead of the consumer
+    by at most READ_AHEAD windows, so a slow writer overlaps with the
+    reads without the whole range piling up in memory. Entries are
+    yielded as each window completes.
+
+    Args:
+        plc: Connected driver instance
+        start: Starting register address (0-based)
+        end: Ending register address (0-based, inclusive)
+        depth: Register batches read at once (default 4)
+
+    Yields:
+        (name, entry) pairs such as ("R1", {"address": 0, "value": 42})
+    """
+    batch_size = 125  # Max registers per request
+    window = batch_size * max(1, depth)
+
+    def read_window(address):
+        spec = ('R', address, min(window, end + 1 - address))
+        return plc.acquire_all([spec], as_array=True)[spec]
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Bounded producer/consumer window: one new window is submitted for
+        # each one consumed, and futures are drained in address order
+        pending = deque()
+        remaining = iter(range(start, end + 1, window))
+        for address in islice(remaining, READ_AHEAD):
+            pending.append(executor.submit(read_window, address))
+
+        addr = start
+        while pending:
+            values = pending.popleft().result()
+            for address in islice(remaining, 1):
+                pending.append(executor.submit(read_window, address))
+
+            for value in values:
+                reg_num = addr + 1  # 1-based for display
+                yield f"R{reg_num}", {"address": addr, "value": value}
+                addr += 1
+
+
+def dump_registers(plc: GE_SRTP_Driver, start: int, end: int, depth: int = PIPELINE_DEPTH) -> Dict[str, Any]:
     """
     Dump a range of registers.
 
@@ -36,39 +158,51 @@ def dump_registers(plc: GE_SRTP_Driver, start: int, end: int) -> Dict[str, Any]:
         plc: Connected driver instance
         start: Starting register address (0-based)
         end: Ending register address (0-based, inclusive)
+        depth: Register batches read at once (default 4)
 
     Returns:
         Dictionary containing register data
     """
     print(f"  Dumping %R{start+1}-%R{end+1} (addresses {start}-{end})...", end=" ")
 
-    count = end - start + 1
-    batch_size = 125  # Max registers per request
+    register_map = dict(iter_registers(plc, start, end, depth))
+
+    print(f"✓ {len(register_map)} registers")
+    return register_map
 
-    all_values = []
 
-    for offset in range(0, count, batch_size):
-        remaining = count - offset
-        read_count = min(batch_size, remaining)
-        values = plc.read_register(start + offset, count=read_count)
+def stream_registers(
+    plc: GE_SRTP_Driver,
+    writer: "JSONStreamWriter",
+    start: int,
+    end: int,
+    depth: int = PIPELINE_DEPTH
+) -> int:
+    """
+    Dump a range of registers straight into an open JSON object.
 
-        if isinstance(values, int):
-            all_values.append(values)
-        else:
-            all_values.extend(values)
-
-    # Create register map
-    register_map = {}
-    for i, value in enumerate(all_values):
-        addr = start + i
-        reg_num = addr + 1  # 1-based for display
-        register_map[f"R{reg_num}"] = {
-            "address": addr,
-            "value": value
-        }
+    Unlike dump_registers, entries are written as each batch arrives and
+    the full register map is never held in memory.
 
-    print(f"✓ {len(all_values)} registers")
-    return register_map
+    Args:
+        plc: Connected driver instance
+        writer: Stream writer positioned inside the registers object
+        start: Starting register address (0-based)
+        end: Ending register address (0-based, inclusive)
+        depth: Register batches read at once (default 4)
+
+    Returns:
+        Number of registers written
+    """
+    print(f"  Dumping %R{start+1}-%R{end+1} (addresses {start}-{end})...", end=" ")
+
+    written = 0
+    for name, entry in iter_registers(plc, start, end, depth):
+        writer.write_member(name, entry)
+        written += 1
+
+    print(f"✓ {written} registers")
+    return written
 
 
 def dump_analog_io(plc: GE_SRTP_Driver, count: int) -> Dict[str, Any]:
@@ -84,8 +218,8 @@ def dump_analog_io(plc: GE_SRTP_Driver, count: int) -> Dict[str, Any]:
     """
     print(f"  Dumping %AI1-%AI{count} and %AQ1-%AQ{count}...", end=" ")
 
-    ai_values = plc.read_analog_input(0, count=count)
-    aq_values = plc.read_analog_output(0, count=count)
+    # Both ranges in one pipelined round trip
+    ai_values, aq_values = plc.read_batch([('AI', 0, count), ('AQ', 0, count)])
 
     # Create analog I/O map
     analog_inputs = {}
@@ -111,50 +245,88 @@ def dump_analog_io(plc: GE_SRTP_Driver, count: int) -> Dict[str, Any]:
     }
 
 
-def get_plc_diagnostics(plc: GE_SRTP_Driver) -> Dict[str, Any]:
+# Diagnostic queries collected by get_plc_diagnostics: result key -> driver method
+DIAGNOSTIC_QUERIES = (
+    ("status", "get_plc_status"),
+    ("controller_info", "get_controller_info"),
+    ("program_names", "get_program_names"),
+    ("datetime", "get_plc_datetime"),
+    ("fault_table", "get_fault_table"),
+)
+
+
+# Diagnostic queries whose answers only change when the PLC is replaced or
+# reprogrammed, and so may be reused across repeated dumps of the same PLC
+IDENTITY_QUERIES = frozenset({"get_controller_info", "get_program_names"})
+
+
+# Identity query results per (host, port, slot, method name), see query_identity
+_identity_cache: Dict[Tuple[str, int, int, str], Dict[str, Any]] = {}
+
+
+def query_identity(plc: GE_SRTP_Driver, method_name: str) -> Dict[str, Any]:
     """
-    Get PLC diagnostic information.
+    Run an identity query once per PLC endpoint and remember the result.
+
+    The cache is keyed on the PLC's address and slot, never shared between
+    PLCs, so one controller's identity can't end up in another's dump.
+    Failed queries raise and are not cached.
 
     Args:
         plc: Connected driver instance
+        method_name: Name of the driver identity method to call
 
     Returns:
-        Dictionary containing diagnostic data
+        Result of the identity query (shared; do not modify)
     """
-    print("  Gathering PLC diagnostics...", end=" ")
+    key = (plc.host, plc.port, plc.slot, method_name)
+    result = _identity_cache.get(key)
+    if result is None:
+        result = _identity_cache[key] = getattr(plc, method_name)()
+    return result
 
-    diagnostics = {}
 
-    try:
-        diagnostics["status"] = plc.get_plc_status()
-    except Exception as e:
-        diagnostics["status"] = {"error": str(e)}
+def get_plc_diagnostics(plc: GE_SRTP_Driver, cache_identity: bool = False) -> Dict[str, Any]:
+    """
+    Get PLC diagnostic information.
 
-    try:
-        diagnostics["controller_info"] = plc.get_controller_info()
-    except Exception as e:
-        diagnostics["controller_info"] = {"error": str(e)}
+    All queries run on plc's own connections. When plc was created with
+    concurrency > 1 they are issued concurrently, one per connection, so
+    no extra PLC sessions are opened.
 
-    try:
-        diagnostics["program_names"] = plc.get_program_names()
-    except Exception as e:
-        diagnostics["program_names"] = {"error": str(e)}
+    Args:
+        plc: Connected driver instance
+        cache_identity: Reuse controller info and program names from an
+            earlier dump of the same PLC in this process (default False)
 
-    try:
-        diagnostics["datetime"] = plc.get_plc_datetime()
-    except Exception as e:
-        diagnostics["datetime"] = {"error": str(e)}
+    Returns:
+        Dictionary containing diagnostic data
+    """
+    print("  Gathering PLC diagnostics...", end=" ")
 
-    try:
-        diagnostics["fault_table"] = plc.get_fault_table()
-    except Exception as e:
-        diagnostics["fault_table"] = {"error": str(e)}
+    def query(method_name: str) -> Dict[str, Any]:
+        if cache_identity and method_name in IDENTITY_QUERIES:
+            return query_identity(plc, method_name)
+        return getattr(plc, method_name)()
+
+    diagnostics = {}
+
+    with ThreadPoolExecutor(max_workers=plc.concurrency) as executor:
+        futures = {
+            key: executor.submit(query, method_name)
+            for key, method_name in DIAGNOSTIC_QUERIES
+        }
+        for key, future in futures.items():
+            try:
+                diagnostics[key] = future.result()
+            except Exception as e:
+                diagnostics[key] = {"error": str(e)}
 
     print("✓")
     return diagnostics
 
 
-def perform_memory_dump(plc_ip: str, cpu_slot: int, output_file: str = None):
+def perform_memory_dump(plc_ip: str, cpu_slot: int, output_file: str = None, cache_identity: bool = False):
     """
     Perform complete memory dump.
 
@@ -162,6 +334,8 @@ def perform_memory_dump(plc_ip: str, cpu_slot: int, output_file: str = None):
         plc_ip: PLC IP address
         cpu_slot: CPU slot number
         output_file: Output JSON file path (optional)
+        cache_identity: Reuse controller info and program names from an
+            earlier dump of the same PLC in this process (default False)
     """
     print("="*80)
     print("GE-SRTP Driver - Memory Dump")
@@ -171,54 +345,67 @@ def perform_memory_dump(plc_ip: str, cpu_slot: int, output_file: str = None):
     print()
 
     # Connect to PLC
-    plc = GE_SRTP_Driver(plc_ip, slot=cpu_slot)
+    plc = GE_SRTP_Driver(plc_ip, slot=cpu_slot, concurrency=PIPELINE_DEPTH)
     plc.connect()
     print("✓ Connected to PLC\n")
 
-    # Create dump data structure
-    dump_data = {
-        "metadata": {
-            "plc_ip": plc_ip,
-            "cpu_slot": cpu_slot,
-            "dump_timestamp": datetime.now().isoformat(),
-            "driver_version": "0.1.0"
-        },
-        "data": {}
+    metadata = {
+        "plc_ip": plc_ip,
+        "cpu_slot": cpu_slot,
+        "dump_timestamp": datetime.now().isoformat(),
+        "driver_version": "0.1.0"
     }
 
-    try:
-        # Dump diagnostics
-        print("[1/3] Collecting diagnostics")
-        dump_data["data"]["diagnostics"] = get_plc_diagnostics(plc)
-        print()
-
-        # Dump registers
-        print("[2/3] Dumping register memory")
-        dump_data["data"]["registers"] = dump_registers(plc, start=0, end=99)  # %R1-%R100
-        print()
-
-        # Dump analog I/O
-        print("[3/3] Dumping analog I/O")
-        dump_data["data"]["analog_io"] = dump_analog_io(plc, count=10)
-        print()
-
-        # Calculate statistics
-        stats = {
-            "registers_dumped": len(dump_data["data"]["registers"]),
-            "analog_inputs_dumped": len(dump_data["data"]["analog_io"]["analog_inputs"]),
-            "analog_outputs_dumped": len(dump_data["data"]["analog_io"]["analog_outputs"]),
-        }
-        dump_data["metadata"]["statistics"] = stats
-
-        print("✓ Memory dump complete!\n")
+    if output_file is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_file = f"plc_dump_{plc_ip}_{timestamp}.json"
 
-        # Save to file
-        if output_file is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = f"plc_dump_{plc_ip}_{timestamp}.json"
+    # Sections are streamed to a temporary file as they are acquired, which
+    # replaces output_file only once the dump is complete, so a failed dump
+    # never leaves a truncated JSON file behind
+    temp_file = output_file + '.tmp'
 
-        with open(output_file, 'w') as f:
-            json.dump(dump_data, f, indent=2)
+    try:
+        # Metadata is written last because its statistics are only known at
+        # the end
+        with open(temp_file, 'wb') as f:
+            writer = JSONStreamWriter(f)
+            writer.begin_object()
+            writer.begin_object("data")
+
+            # Dump diagnostics
+            print("[1/3] Collecting diagnostics")
+            writer.write_member("diagnostics", get_plc_diagnostics(plc, cache_identity))
+            print()
+
+            # Dump registers
+            print("[2/3] Dumping register memory")
+            writer.begin_object("registers")
+            registers_dumped = stream_registers(plc, writer, start=0, end=99)  # %R1-%R100
+            writer.end_object()
+            print()
+
+            # Dump analog I/O
+            print("[3/3] Dumping analog I/O")
+            analog_io = dump_analog_io(plc, count=10)
+            writer.write_member("analog_io", analog_io)
+            print()
+
+            writer.end_object()
+
+            # Calculate statistics
+            stats = {
+                "registers_dumped": registers_dumped,
+                "analog_inputs_dumped": len(analog_io["analog_inputs"]),
+                "analog_outputs_dumped": len(analog_io["analog_outputs"]),
+            }
+            metadata["statistics"] = stats
+
+            writer.write_member("metadata", metadata)
+            writer.end_object()
+
+        os.replace(temp_file, output_file)
+        print("✓ Memory dump complete!\n")
 
         print(f"✓ Dump saved to: {output_file}")
 
@@ -228,10 +415,12 @@ def perform_memory_dump(plc_ip: str, cpu_slot: int, output_file: str = None):
         print(f"  Registers:      {stats['registers_dumped']}")
         print(f"  Analog Inputs:  {stats['analog_inputs_dumped']}")
         print(f"  Analog Outputs: {stats['analog_outputs_dumped']}")
-        print(f"  File size:      {os.path.getsize(output_file):,} bytes")
+        print(f"  File size:      {writer.bytes_written:,} bytes")
         print("-"*80)
 
     finally:
+        if os.path.exists(temp_file):
+            os.unlink(temp_file)
         plc.disconnect()
         print("\n✓ Disconnected from PLC")
 
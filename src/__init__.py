@@ -59,16 +59,35 @@ __author__ = "Jobe Eli Eastwood"
 __email__ = "jobeastwood@hotmail.com"
 __license__ = "MIT"
 
-from . import protocol
-from . import exceptions
-from . import packet
-from . import connection
-from .driver import GE_SRTP_Driver
+import importlib
 
 __all__ = [
     'protocol',
     'exceptions',
     'packet',
     'connection',
+    'pool',
+    'async_connection',
     'GE_SRTP_Driver',
 ]
+
+# Submodules and the driver class are imported on first access (PEP 562),
+# so importing the package alone stays cheap for short-lived scripts
+_SUBMODULES = frozenset({'protocol', 'exceptions', 'packet', 'connection', 'pool',
+                         'async_connection', 'driver'})
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        value = importlib.import_module(f'.{name}', __name__)
+    elif name == 'GE_SRTP_Driver':
+        value = importlib.import_module('.driver', __name__).GE_SRTP_Driver
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+gesrtp-py - GE-SRTP PLC Driver
+
+Copyright (c) 2025 Jobe Eli Eastwood
+Houston, TX
+
+A Python driver for communicating with GE PLCs using the SRTP protocol.
+Read-only driver for forensic memory acquisition and PLC monitoring.
+
+Author: Jobe Eli Eastwood <jobeastwood@hotmail.com>
+Project: https://github.com/jobeastwood/gesrtp-py
+License: MIT
+
+---
+
+Asyncio Connection for GE-SRTP Protocol
+
+SRTPConnection sends one request and blocks until its response arrives.
+AsyncSRTPConnection runs on asyncio streams instead: any number of
+coroutines can have requests outstanding on one connection, and a
+background task matches each response to its request by sequence number.
+This keeps the link busy on PLCs that accept several requests in flight.
+"""
+
+import asyncio
+import logging
+import socket
+from typing import Dict, Optional
+
+from .packet import SRTPPacket
+from . import protocol
+from . import exceptions
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSRTPConnection:
+    """
+    SRTP connection on asyncio streams with several requests in flight.
+
+    Example:
+        ```python
+        async def main():
+            async with AsyncSRTPConnection('172.16.12.127') as conn:
+                requests = [
+                    SRTPPacket.build_request(
+                        conn.next_sequence_number(),
+                        protocol.ServiceCode.READ_SYSTEM_MEMORY,
+                        protocol.SegmentSelector.REGISTERS_WORD,
+                        offset, 125, slot=0
+                    )
+                    for offset in range(0, 1000, 125)
+                ]
+                responses = await asyncio.gather(*map(conn.request, requests))
+
+        asyncio.run(main())
+        ```
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int = protocol.DEFAULT_PORT,
+        timeout: int = protocol.DEFAULT_TIMEOUT
+    ):
+        """
+        Initialize connection parameters.
+
+        Args:
+            host: PLC IP address or hostname
+            port: TCP port (default 18245)
+            timeout: Seconds to wait for a connection or a response (default 5)
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.is_connected = False
+        self.sequence_number = 0
+
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._receiver: Optional[asyncio.Task] = None
+        # Futures of outstanding requests, keyed by sequence number
+        self._pending: Dict[int, asyncio.Future] = {}
+
+    def next_sequence_number(self) -> int:
+        """
+        Get the next request sequence number for this connection.
+
+        Returns:
+            Next sequence number (0-255)
+        """
+        seq = self.sequence_number
+        self.sequence_number = (seq + 1) & 0xFF
+        return seq
+
+    async def connect(self) -> None:
+        """
+        Open the TCP connection and perform the initialization handshake.
+
+        Raises:
+            TimeoutError: If the PLC does not answer in time
+            ConnectionError: If the connection fails
+            InitializationError: If the initialization handshake fails
+        """
+        if self.is_connected:
+            logger.warning("Already connected")
+            return
+
+        logger.info("Connecting to PLC at %s:%s...", self.host, self.port)
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), self.timeout
+            )
+            sock = self._writer.get_extra_info('socket')
+            if sock is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+            self._writer.write(protocol.INIT_PACKET_1)
+            response = await asyncio.wait_for(self._read_response(), self.timeout)
+        except asyncio.TimeoutError as e:
+            await self._close()
+            raise exceptions.TimeoutError(
+                f"Connection timeout to {self.host}:{self.port}"
+            ) from e
+        except (OSError, asyncio.IncompleteReadError) as e:
+            await self._close()
+            raise exceptions.ConnectionError(
+                f"Failed to connect to {self.host}:{self.port}: {e}"
+            ) from e
+
+        if response[0] != 0x01:
+            await self._close()
+            raise exceptions.InitializationError(
+                f"Invalid response to init packet 1: expected 0x01, got 0x{response[0]:02X}"
+            )
+
+        self.is_connected = True
+        self.sequence_number = 0
+        self._receiver = asyncio.create_task(self._receive_loop())
+        logger.info("Initialization handshake complete")
+
+    async def request(self, request_data: bytes) -> SRTPPacket:
+        """
+        Send a request and wait for its response.
+
+        Other requests may be sent while this one is outstanding; responses
+        are matched by the sequence number in byte 2 of the request.
+
+        Args:
+            request_data: Complete request packet from SRTPPacket.build_request()
+
+        Returns:
+            Parsed response packet
+
+        Raises:
+            ConnectionError: If not connected or the connection fails
+            TimeoutError: If no response arrives in time
+            ProtocolError: If the sequence number is already in use
+        """
+        if not self.is_connected or self._writer is None:
+            raise exceptions.ConnectionError("Not connected to PLC")
+
+        seq = request_data[2]
+        if seq in self._pending:
+            raise exceptions.ProtocolError(
+                f"Sequence number {seq} already has a request outstanding"
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[seq] = future
+        try:
+            self._writer.write(request_data)
+            await self._writer.drain()
+            data = await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError as e:
+            raise exceptions.TimeoutError("Timeout receiving response") from e
+        except OSError as e:
+            raise exceptions.ConnectionError(f"Error sending request: {e}") from e
+        finally:
+            self._pending.pop(seq, None)
+
+        return SRTPPacket.parse_response(data)
+
+    async def _read_response(self) -> bytes:
+        """
+        Read one complete response: the 56-byte header plus the payload
+        whose length is given in header byte 4.
+
+        Returns:
+            Raw response bytes
+        """
+        header = await self._reader.readexactly(protocol.HEADER_SIZE)
+        payload_length = header[4]
+        if payload_length:
+            return header + await self._reader.readexactly(payload_length)
+        return header
+
+    async def _receive_loop(self) -> None:
+        """
+        Read responses and hand each to the request waiting on its sequence number.
+
+        Runs as a background task while connected. A read error fails every
+        outstanding request.
+        """
+        try:
+            while True:
+                data = await self._read_response()
+
+                future = self._pending.get(data[2])
+                if future is None or future.done():
+                    logger.warning("Discarding response with unexpected sequence number %d", data[2])
+                    continue
+                future.set_result(data)
+        except asyncio.CancelledError:
+            raise
+        except (OSError, asyncio.IncompleteReadError) as e:
+            self.is_connected = False
+            error = exceptions.ConnectionError(f"Error receiving response: {e}")
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+
+    async def disconnect(self) -> None:
+        """
+        Close the connection, failing any outstanding requests.
+        """
+        if self._receiver is not None:
+            self._receiver.cancel()
+            try:
+                await self._receiver
+            except asyncio.CancelledError:
+                pass
+            self._receiver = None
+
+        error = exceptions.ConnectionError("Connection closed")
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+        await self._close()
+        logger.info("Disconnected from %s:%s", self.host, self.port)
+
+    async def _close(self) -> None:
+        """Close the stream writer, ignoring errors."""
+        self.is_connected = False
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError as e:
+                logger.error("Error closing socket: %s", e)
+            self._writer = None
+            self._reader = None
+
+    async def __aenter__(self):
+        """Async context manager entry - connect to PLC."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit - disconnect from PLC."""
+        await self.disconnect()
+        return False
+
+    def __repr__(self) -> str:
+        """String representation of connection."""
+        status = "connected" if self.is_connected else "disconnected"
+        return (
+            f"AsyncSRTPConnection({self.host}:{self.port}, {status}, "
+            f"{len(self._pending)} pending)"
+        )
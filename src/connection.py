@@ -26,7 +26,8 @@ NOT documented in the academic paper.
 
 import socket
 import logging
-from typing import Optional
+import time
+from typing import List, Optional
 
 from . import protocol
 from . import exceptions
@@ -34,6 +35,23 @@ from . import exceptions
 
 logger = logging.getLogger(__name__)
 
+# Bytes read from the socket per recv; holds many complete responses
+# (56-byte header + at most 255 payload bytes each)
+RECEIVE_BUFFER_SIZE = 8192
+
+# Keepalive timing: first probe after 10 s idle, then every 5 s, give up
+# after 3 missed probes, so a dead PLC is noticed within ~25 s instead
+# of the OS default of two hours. Options missing on this OS are skipped
+_KEEPALIVE_OPTIONS = [
+    (getattr(socket, name), value)
+    for name, value in (('TCP_KEEPIDLE', 10), ('TCP_KEEPINTVL', 5), ('TCP_KEEPCNT', 3))
+    if hasattr(socket, name)
+]
+
+# Linux only; elsewhere responses split into header and payload packets
+# may wait for the delayed ACK timer
+_TCP_QUICKACK = getattr(socket, 'TCP_QUICKACK', None)
+
 
 class SRTPConnection:
     """
@@ -46,11 +64,20 @@ class SRTPConnection:
     - Connection lifecycle management
     """
 
+    # No per-instance __dict__; pools may keep many idle connections
+    __slots__ = (
+        'host', 'port', 'timeout', 'recv_buf', 'send_buf',
+        'sock', 'is_connected', 'is_initialized', 'sequence_number',
+        '_recv_buffer', '_recv_view', '_recv_start', '_recv_end', '_quickack',
+    )
+
     def __init__(
         self,
         host: str,
         port: int = protocol.DEFAULT_PORT,
-        timeout: int = protocol.DEFAULT_TIMEOUT
+        timeout: int = protocol.DEFAULT_TIMEOUT,
+        recv_buf: Optional[int] = None,
+        send_buf: Optional[int] = None
     ):
         """
         Initialize connection parameters.
@@ -59,15 +86,43 @@ class SRTPConnection:
             host: PLC IP address or hostname
             port: TCP port (default 18245)
             timeout: Socket timeout in seconds (default 5)
+            recv_buf: Socket receive buffer size (SO_RCVBUF) in bytes. Leave
+                unset to keep the OS default and its autotuning; only worth
+                setting on high-latency links such as WAN or satellite.
+            send_buf: Socket send buffer size (SO_SNDBUF) in bytes, as above
         """
         self.host = host
         self.port = port
         self.timeout = timeout
+        self.recv_buf = recv_buf
+        self.send_buf = send_buf
         self.sock: Optional[socket.socket] = None
         self.is_connected = False
         self.is_initialized = False
+        self.sequence_number = 0
 
-        logger.info(f"Initialized SRTP connection for {host}:{port}")
+        # Reusable receive buffer. Each recv reads as much as is available,
+        # so pipelined responses that arrive together cost one syscall;
+        # bytes [_recv_start, _recv_end) are received but not yet consumed
+        self._recv_buffer = bytearray(RECEIVE_BUFFER_SIZE)
+        self._recv_view = memoryview(self._recv_buffer)
+        self._recv_start = 0
+        self._recv_end = 0
+        # Whether the current receive still has to re-arm TCP_QUICKACK
+        self._quickack = False
+
+        logger.info("Initialized SRTP connection for %s:%s", host, port)
+
+    def next_sequence_number(self) -> int:
+        """
+        Get the next request sequence number for this connection.
+
+        Returns:
+            Next sequence number (0-255)
+        """
+        seq = self.sequence_number
+        self.sequence_number = (seq + 1) & 0xFF
+        return seq
 
     def connect(self) -> None:
         """
@@ -86,14 +141,34 @@ class SRTPConnection:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.sock.settimeout(self.timeout)
 
+            # Requests are small and latency-bound: send them immediately
+            # instead of letting Nagle's algorithm hold them back, and let
+            # the OS detect a PLC that silently dropped off the network
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            for option, value in _KEEPALIVE_OPTIONS:
+                self.sock.setsockopt(socket.IPPROTO_TCP, option, value)
+
+            # Fixed buffer sizes turn off the kernel's autotuning, so they
+            # are only set when asked for; the kernel may clamp or double them
+            if self.recv_buf:
+                self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.recv_buf)
+                logger.info("Receive buffer set to %d bytes",
+                            self.sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF))
+            if self.send_buf:
+                self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.send_buf)
+                logger.info("Send buffer set to %d bytes",
+                            self.sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF))
+
             # Connect to PLC
-            logger.info(f"Connecting to PLC at {self.host}:{self.port}...")
+            logger.info("Connecting to PLC at %s:%s...", self.host, self.port)
             self.sock.connect((self.host, self.port))
             self.is_connected = True
             logger.info("TCP connection established")
 
             # Perform initialization handshake
             self._perform_initialization()
+            self.sequence_number = 0
 
         except socket.timeout as e:
             raise exceptions.TimeoutError(
@@ -127,12 +202,9 @@ class SRTPConnection:
             logger.debug("Sending initialization packet 1...")
             self.sock.sendall(protocol.INIT_PACKET_1)
 
-            # Wait for response to init packet 1
+            # Wait for response to init packet 1 (_receive_data returns at
+            # least a complete 56-byte header or raises)
             response1 = self._receive_data(56)
-            if len(response1) < 1:
-                raise exceptions.InitializationError(
-                    "No response to initialization packet 1"
-                )
 
             # Validate response - byte[0] should be 0x01
             if response1[0] != 0x01:
@@ -140,7 +212,8 @@ class SRTPConnection:
                     f"Invalid response to init packet 1: expected 0x01, got 0x{response1[0]:02X}"
                 )
 
-            logger.debug(f"Init packet 1 response received: {response1[:8].hex()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Init packet 1 response received: %s", response1[:8].hex())
 
             # INITIALIZATION PACKET 2
             # Note: The second initialization packet pattern needs to be determined
@@ -184,14 +257,59 @@ class SRTPConnection:
             raise exceptions.ConnectionError("Connection not initialized")
 
         try:
-            logger.debug(f"Sending {len(request_data)} bytes to PLC")
             self.sock.sendall(request_data)
-            logger.debug(f"Sent packet: {request_data[:56].hex()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sent %d bytes to PLC: %s", len(request_data), request_data[:56].hex())
 
         except socket.timeout as e:
+            # Part of the request may have been sent; never reuse this stream
+            self.disconnect()
             raise exceptions.TimeoutError("Timeout sending request") from e
         except socket.error as e:
-            self.is_connected = False
+            self.disconnect()
+            raise exceptions.ConnectionError(f"Error sending request: {e}") from e
+
+    def send_requests(self, packets: List[bytes]) -> None:
+        """
+        Send several request packets with a single system call.
+
+        Uses scatter/gather sendmsg() where the platform has it, so the
+        packets leave in as few TCP segments as possible without first
+        being copied into one buffer.
+
+        The kernel gathers the buffers itself, so a packet can also be
+        passed as separate pieces (e.g. a 56-byte header followed by its
+        payload) without concatenating them first.
+
+        Args:
+            packets: Packets, or consecutive pieces of packets, to send in order
+
+        Raises:
+            ConnectionError: If not connected or send fails
+        """
+        if not self.is_connected or self.sock is None:
+            raise exceptions.ConnectionError("Not connected to PLC")
+
+        if not self.is_initialized:
+            raise exceptions.ConnectionError("Connection not initialized")
+
+        try:
+            logger.debug("Sending %d packets to PLC", len(packets))
+            if hasattr(self.sock, 'sendmsg'):
+                sent = self.sock.sendmsg(packets)
+                total = sum(map(len, packets))
+                if sent < total:
+                    # Short write: send whatever the kernel did not take
+                    self.sock.sendall(b''.join(packets)[sent:])
+            else:
+                self.sock.sendall(b''.join(packets))
+
+        except socket.timeout as e:
+            # Part of the request may have been sent; never reuse this stream
+            self.disconnect()
+            raise exceptions.TimeoutError("Timeout sending request") from e
+        except socket.error as e:
+            self.disconnect()
             raise exceptions.ConnectionError(f"Error sending request: {e}") from e
 
     def receive_response(self, expected_size: int = 1024) -> bytes:
@@ -213,59 +331,145 @@ class SRTPConnection:
 
         return self._receive_data(expected_size)
 
+    def receive_response_view(self) -> memoryview:
+        """
+        Receive a response packet from the PLC without copying it.
+
+        Like receive_response(), but returns a view into the connection's
+        receive buffer. The view is only valid until the next receive on
+        this connection, so parse it (SRTPPacket.parse_response copies the
+        payload out) before receiving again.
+
+        Returns:
+            Response data (header + payload) as a memoryview
+
+        Raises:
+            ConnectionError: If not connected or receive fails
+            TimeoutError: If receive times out
+        """
+        if not self.is_connected or self.sock is None:
+            raise exceptions.ConnectionError("Not connected to PLC")
+
+        return self._receive_view()
+
     def _receive_data(self, max_bytes: int) -> bytes:
         """
         Internal method to receive data from socket.
 
+        Args:
+            max_bytes: Maximum bytes to receive
+
+        Returns:
+            Received data (header + payload)
+
+        Raises:
+            TimeoutError: If receive times out
+            ConnectionError: If receive fails
+        """
+        return bytes(self._receive_view())
+
+    def _receive_view(self) -> memoryview:
+        """
+        Receive one response into the receive buffer.
+
         The PLC sends responses in multiple TCP packets:
         - First packet: 56-byte header
         - Second packet: payload data (if any)
 
-        Byte 4 of the header indicates the payload length.
-
-        Args:
-            max_bytes: Maximum bytes to receive
+        Byte 4 of the header indicates the payload length. The socket
+        timeout bounds the whole response, not each recv, so a PLC that
+        trickles bytes in cannot stretch a read past the timeout.
 
         Returns:
-            Received data (header + payload)
+            View of the received data (header + payload), valid until the
+            next receive
 
         Raises:
             TimeoutError: If receive times out
             ConnectionError: If receive fails
         """
+        deadline = time.monotonic() + self.timeout if self.timeout else None
+        self._quickack = _TCP_QUICKACK is not None
         try:
-            # First, receive the 56-byte header
-            header = self.sock.recv(56)
+            # First, make sure the 56-byte header is buffered
+            self._fill(protocol.HEADER_SIZE, deadline)
+            start = self._recv_start
 
-            if not header:
-                self.is_connected = False
-                raise exceptions.ConnectionError("Connection closed by PLC")
+            # Check byte 4 for payload length indicator
+            payload_length = self._recv_buffer[start + 4]
+            total = protocol.HEADER_SIZE + payload_length
 
-            logger.debug(f"Received header: {len(header)} bytes")
-            logger.debug(f"Response header: {header.hex()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response header: %s (expecting %d bytes of payload)",
+                             self._recv_view[start:start + protocol.HEADER_SIZE].hex(),
+                             payload_length)
 
-            # Check byte 4 for payload length indicator
-            payload_length = header[4] if len(header) > 4 else 0
-
-            if payload_length > 0:
-                # Receive the payload in a second packet
-                logger.debug(f"Expecting {payload_length} bytes of payload")
-                payload = self.sock.recv(payload_length)
-                logger.debug(f"Received payload: {len(payload)} bytes")
-
-                # Combine header and payload
-                data = header + payload
-                logger.debug(f"Total data: {len(data)} bytes")
-                return data
-            else:
-                # No payload, just return header
-                return header
+            # The payload usually arrives as a second TCP packet behind the header
+            if self._recv_end - start < total:
+                self._fill(total, deadline)
+                start = self._recv_start
+
+            self._recv_start = start + total
+            return self._recv_view[start:start + total]
 
         except socket.timeout as e:
+            # The late response may still arrive and would be taken as the
+            # answer to the next request, so this stream is never reused
+            self.disconnect()
             raise exceptions.TimeoutError("Timeout receiving response") from e
         except socket.error as e:
-            self.is_connected = False
+            self.disconnect()
             raise exceptions.ConnectionError(f"Error receiving response: {e}") from e
+        finally:
+            if deadline is not None and self.sock is not None:
+                self.sock.settimeout(self.timeout)
+
+    def _fill(self, size: int, deadline: Optional[float] = None) -> None:
+        """
+        Make sure at least size unconsumed bytes are in the receive buffer.
+
+        Reads whatever the socket has available, which may already include
+        the following responses, until size bytes are buffered.
+
+        Args:
+            size: Number of bytes needed from _recv_start on
+            deadline: time.monotonic() value by which the bytes must have
+                arrived; None to only apply the socket timeout per recv
+
+        Raises:
+            socket.timeout: If the deadline passes first
+            ConnectionError: If the PLC closes the connection
+        """
+        if self._recv_end - self._recv_start >= size:
+            return
+
+        # Move the unconsumed tail to the front when the packet would not fit
+        if self._recv_start + size > RECEIVE_BUFFER_SIZE or self._recv_start == self._recv_end:
+            pending = self._recv_end - self._recv_start
+            self._recv_buffer[:pending] = self._recv_view[self._recv_start:self._recv_end]
+            self._recv_start = 0
+            self._recv_end = pending
+
+        view = self._recv_view
+        needed = self._recv_start + size
+        while self._recv_end < needed:
+            if self._quickack:
+                # ACK what we have now, once per response: the PLC holds back
+                # small packets (e.g. the payload behind a header) until
+                # earlier ones are acknowledged, and delayed ACK would add
+                # ~40 ms per wait
+                self._quickack = False
+                self.sock.setsockopt(socket.IPPROTO_TCP, _TCP_QUICKACK, 1)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise socket.timeout("Response deadline exceeded")
+                self.sock.settimeout(remaining)
+            received = self.sock.recv_into(view[self._recv_end:])
+            if not received:
+                self.disconnect()
+                raise exceptions.ConnectionError("Connection closed by PLC")
+            self._recv_end += received
 
     def disconnect(self) -> None:
         """
@@ -274,22 +478,39 @@ class SRTPConnection:
         if self.sock:
             try:
                 self.sock.close()
-                logger.info(f"Disconnected from {self.host}:{self.port}")
+                logger.info("Disconnected from %s:%s", self.host, self.port)
             except Exception as e:
-                logger.error(f"Error closing socket: {e}")
+                logger.error("Error closing socket: %s", e)
             finally:
                 self.sock = None
                 self.is_connected = False
                 self.is_initialized = False
+                self._recv_start = self._recv_end = 0
 
     def is_alive(self) -> bool:
         """
         Check if connection is still alive.
 
+        Besides the connection flags, checks the socket for a pending error,
+        such as a keepalive timeout after the PLC dropped off the network.
+
         Returns:
-            True if connected and initialized
+            True if connected, initialized and the socket reports no error
         """
-        return self.is_connected and self.is_initialized
+        if not (self.is_connected and self.is_initialized and self.sock is not None):
+            return False
+
+        try:
+            error = self.sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        except OSError:
+            error = -1
+
+        if error:
+            logger.warning("Connection to %s:%s lost (socket error %s)", self.host, self.port, error)
+            self.is_connected = False
+            return False
+
+        return True
 
     def set_timeout(self, timeout: int) -> None:
         """
@@ -301,7 +522,7 @@ class SRTPConnection:
         self.timeout = timeout
         if self.sock:
             self.sock.settimeout(timeout)
-            logger.debug(f"Socket timeout updated to {timeout}s")
+            logger.debug("Socket timeout updated to %ss", timeout)
 
     def __enter__(self):
         """Context manager entry - connect to PLC."""
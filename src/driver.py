@@ -24,11 +24,18 @@ WARNING: Write operations are intentionally NOT implemented for safety.
          This is a READ-ONLY driver focused on forensic acquisition.
 """
 
+import array
 import logging
-from typing import List, Dict, Any, Union, Optional
+import queue
+import struct
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterator, Union, Optional, Tuple
 from datetime import datetime
 
 from .connection import SRTPConnection
+from .pool import SRTPConnectionPool
 from .packet import SRTPPacket
 from . import protocol
 from . import exceptions
@@ -36,6 +43,48 @@ from . import exceptions
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of requests sent before their responses are read back
+PIPELINE_WINDOW = 16
+
+# Number of distinct request headers kept for reuse by a driver
+REQUEST_CACHE_SIZE = 256
+
+# Memory types by address prefix; %R, %AI and %AQ are word-addressed
+_MEMORY_TYPES = {
+    'R': protocol.MemoryType.REGISTER,
+    'AI': protocol.MemoryType.ANALOG_INPUT,
+    'AQ': protocol.MemoryType.ANALOG_OUTPUT,
+    'I': protocol.MemoryType.DISCRETE_INPUT,
+    'Q': protocol.MemoryType.DISCRETE_OUTPUT,
+    'T': protocol.MemoryType.DISCRETE_TEMP,
+    'M': protocol.MemoryType.DISCRETE_INTERNAL,
+    'SA': protocol.MemoryType.SYSTEM_A,
+    'SB': protocol.MemoryType.SYSTEM_B,
+    'SC': protocol.MemoryType.SYSTEM_C,
+    'S': protocol.MemoryType.SYSTEM_S,
+    'G': protocol.MemoryType.GENIUS_GLOBAL,
+}
+_WORD_MEMORY_TYPES = frozenset({'R', 'AI', 'AQ'})
+_SYSTEM_MEMORY_TYPES = frozenset({'S', 'SA', 'SB', 'SC'})
+
+# Segment selector for every (prefix, access mode) pair, resolved once at import
+_SELECTORS = {
+    (name, mode): protocol.get_segment_selector_for_memory_type(mem_type, mode)
+    for name, mem_type in _MEMORY_TYPES.items()
+    for mode in (('word',) if name in _WORD_MEMORY_TYPES else ('bit', 'byte'))
+}
+
+# Largest range one read may cover (a 250-byte payload) and the minimum
+# data_length the PLC accepts, per access mode (minimums verified on RX3i)
+_MAX_SPAN = {'word': 125, 'byte': 250, 'bit': 2000}
+_MIN_REQUEST_LENGTH = {'word': 4, 'byte': 8, 'bit': 64}
+
+# Precompiled little-endian int16 unpackers for every legal word count
+_WORD_STRUCTS = [struct.Struct(f'<{n}h') for n in range(_MAX_SPAN['word'] + 1)]
+
+# SRTP words are little-endian int16, which is array('h') on little-endian hosts
+_NATIVE_WORDS = sys.byteorder == 'little' and array.array('h').itemsize == 2
+
 
 class GE_SRTP_Driver:
     """
@@ -64,7 +113,9 @@ class GE_SRTP_Driver:
         host: str,
         port: int = protocol.DEFAULT_PORT,
         timeout: int = protocol.DEFAULT_TIMEOUT,
-        slot: int = 1
+        slot: int = 1,
+        concurrency: int = 1,
+        pool: Optional[SRTPConnectionPool] = None
     ):
         """
         Initialize the PLC driver.
@@ -74,33 +125,86 @@ class GE_SRTP_Driver:
             port: TCP port (default 18245)
             timeout: Socket timeout in seconds (default 5)
             slot: CPU slot number (default 1, use 2 if CPU is in slot 2)
+            concurrency: Number of connections opened to the PLC (default 1).
+                Each request checks out a free connection, so up to this many
+                threads can read at the same time. Keep within the PLC's
+                concurrent session limit.
+            pool: Take connections from this SRTPConnectionPool on connect()
+                and return them on disconnect(), so later sessions skip the
+                connection handshake. The pool's timeout applies.
         """
+        if concurrency < 1:
+            raise exceptions.ValidationError(f"Concurrency must be at least 1, got {concurrency}")
+
         self.host = host
         self.port = port
         self.timeout = timeout
         self.slot = slot
-        self.connection = SRTPConnection(host, port, timeout)
-        self.sequence_number = 0
+        self.concurrency = concurrency
+        self.connection_pool = pool
+        self._use_connections([SRTPConnection(host, port, timeout) for _ in range(concurrency)])
+
+        # Prebuilt request headers keyed by (service, selector, offset, length)
+        self._request_templates: Dict[Tuple[int, int, int, int], bytes] = {}
 
-        logger.info(f"Initialized GE-SRTP driver for {host}:{port} (CPU slot {slot})")
+        logger.info("Initialized GE-SRTP driver for %s:%s (CPU slot %s)", host, port, slot)
 
     def connect(self) -> None:
         """
         Connect to the PLC and perform initialization.
 
+        Opens `concurrency` connections; if any of them fails, the ones
+        already opened are closed again.
+
         Raises:
             ConnectionError: If connection fails
             InitializationError: If initialization handshake fails
         """
-        self.connection.connect()
-        self.sequence_number = 0
-        logger.info("Driver connected and ready")
+        try:
+            if self.connection_pool is not None:
+                acquired = []
+                try:
+                    for _ in range(self.concurrency):
+                        acquired.append(self.connection_pool.acquire(self.host, self.port))
+                finally:
+                    self._use_connections(acquired + self._connections[len(acquired):])
+            else:
+                for connection in self._connections:
+                    connection.connect()
+        except exceptions.SRTPException:
+            self.disconnect()
+            raise
+        logger.info("Driver connected and ready (%d connection(s))", self.concurrency)
 
     def disconnect(self) -> None:
-        """Disconnect from the PLC."""
-        self.connection.disconnect()
+        """Disconnect from the PLC (or return the connections to the pool)."""
+        if self.connection_pool is not None:
+            # A connection that timed out or failed has closed itself and is
+            # not handed back, so a late response never reaches the next session
+            for connection in self._connections:
+                if connection.is_connected:
+                    self.connection_pool.release(connection)
+            self._use_connections([
+                SRTPConnection(self.host, self.port, self.timeout) for _ in range(self.concurrency)
+            ])
+        else:
+            for connection in self._connections:
+                connection.disconnect()
         logger.info("Driver disconnected")
 
+    def _use_connections(self, connections: List[SRTPConnection]) -> None:
+        """
+        Make connections the driver's connections, the first one primary.
+
+        Args:
+            connections: concurrency connections; idle ones wait in the pool
+        """
+        self.connection = connections[0]
+        self._connections = connections
+        self._pool: "queue.Queue[SRTPConnection]" = queue.Queue()
+        for connection in connections:
+            self._pool.put(connection)
+
     def is_connected(self) -> bool:
         """
         Check if connected to PLC.
@@ -110,16 +214,68 @@ class GE_SRTP_Driver:
         """
         return self.connection.is_alive()
 
-    def _get_next_sequence_number(self) -> int:
+    @contextmanager
+    def _checkout_connection(self) -> Iterator[SRTPConnection]:
         """
-        Get next sequence number and increment counter.
+        Borrow an idle connection from the pool for one exchange.
+
+        Blocks until a connection is free, which also serializes callers
+        when concurrency is 1.
+
+        Yields:
+            Connection reserved for the caller
+        """
+        # disconnect() swaps in a new queue; return the connection to the
+        # queue it came from
+        pool = self._pool
+        connection = pool.get()
+        try:
+            yield connection
+        finally:
+            pool.put(connection)
+
+    def _build_request(
+        self,
+        sequence_number: int,
+        service_code: int,
+        segment_selector: int,
+        data_offset: int,
+        data_length: int
+    ) -> bytearray:
+        """
+        Build a request packet, reusing the header of an identical earlier request.
+
+        Polling loops repeat the same few requests, so the full header is
+        built once per distinct request and later copies only get a new
+        sequence number and timestamp.
+
+        Args:
+            sequence_number: Packet sequence number (0-255)
+            service_code: Service request code
+            segment_selector: Segment selector for memory access
+            data_offset: Memory address offset
+            data_length: Number of bytes/words to read
 
         Returns:
-            Next sequence number (0-255)
+            Request packet ready to send
         """
-        seq = self.sequence_number
-        self.sequence_number = (self.sequence_number + 1) % 256
-        return seq
+        key = (service_code, segment_selector, data_offset, data_length)
+        template = self._request_templates.get(key)
+
+        if template is None:
+            template = SRTPPacket.build_request(
+                sequence_number=sequence_number,
+                service_code=service_code,
+                segment_selector=segment_selector,
+                data_offset=data_offset,
+                data_length=data_length,
+                slot=self.slot
+            )
+            if len(self._request_templates) >= REQUEST_CACHE_SIZE:
+                self._request_templates.clear()
+            self._request_templates[key] = template
+
+        return SRTPPacket.restamp_request(template, sequence_number)
 
     def _send_request_and_receive(
         self,
@@ -144,38 +300,155 @@ class GE_SRTP_Driver:
             ConnectionError: If not connected
             ProtocolError: If request/response fails
         """
-        # Get sequence number
-        seq = self._get_next_sequence_number()
-
-        # Build request packet
-        request = SRTPPacket.build_request(
-            sequence_number=seq,
-            service_code=service_code,
-            segment_selector=segment_selector,
-            data_offset=data_offset,
-            data_length=data_length,
-            slot=self.slot
-        )
+        with self._checkout_connection() as connection:
+            # Get sequence number (next_sequence_number() inlined, this runs
+            # once per request)
+            seq = connection.sequence_number
+            connection.sequence_number = (seq + 1) & 0xFF
 
-        # Send request
-        self.connection.send_request(request)
+            # Build request packet
+            request = self._build_request(
+                seq, service_code, segment_selector, data_offset, data_length
+            )
 
-        # Receive response
-        response_data = self.connection.receive_response()
+            # Send request
+            connection.send_request(request)
 
-        # Parse response
-        response = SRTPPacket.parse_response(response_data)
+            # Receive and parse the response while the connection's receive
+            # buffer, which the view points into, is still ours
+            response = SRTPPacket.parse_response(connection.receive_response_view())
 
         # Validate sequence number
         response.validate_sequence_number(seq)
 
         return response
 
+    def _send_requests_and_receive(
+        self,
+        requests: List[Tuple[int, int, int, int]]
+    ) -> List[SRTPPacket]:
+        """
+        Send several service requests back-to-back, then receive the responses.
+
+        Requests are written in windows of PIPELINE_WINDOW packets with a
+        single send each; the responses of a window are read in order and
+        matched by sequence number before the next window is sent.
+
+        Args:
+            requests: (service_code, segment_selector, data_offset, data_length) tuples
+
+        Returns:
+            Parsed response packets, in request order
+
+        Raises:
+            ConnectionError: If not connected
+            ProtocolError: If a request/response fails
+        """
+        responses = []
+
+        with self._checkout_connection() as connection:
+            for first in range(0, len(requests), PIPELINE_WINDOW):
+                window = requests[first:first + PIPELINE_WINDOW]
+                sequence_numbers = []
+                packets = []
+
+                for service_code, segment_selector, data_offset, data_length in window:
+                    seq = connection.next_sequence_number()
+                    sequence_numbers.append(seq)
+                    packets.append(self._build_request(
+                        seq, service_code, segment_selector, data_offset, data_length
+                    ))
+
+                connection.send_requests(packets)
+
+                for i, seq in enumerate(sequence_numbers):
+                    try:
+                        response = SRTPPacket.parse_response(connection.receive_response_view())
+                        response.validate_sequence_number(seq)
+                    except exceptions.SRTPException:
+                        # A PLC error reply leaves the stream intact: read and
+                        # drop the rest of the window so the connection goes
+                        # back in sync. A transport failure has already closed
+                        # the connection, so there is nothing left to drain.
+                        if connection.is_connected:
+                            for _ in sequence_numbers[i + 1:]:
+                                connection.receive_response_view()
+                        raise
+                    responses.append(response)
+
+        return responses
+
     # ========================================================================
     # REGISTER MEMORY OPERATIONS (%R)
     # ========================================================================
 
-    def read_register(self, address: int, count: int = 1) -> Union[int, List[int]]:
+    def _read_words(
+        self,
+        description: str,
+        prefix: str,
+        address: int,
+        count: int,
+        as_array: bool,
+        number_base: int = 0
+    ) -> Union[int, List[int], 'array.array[int]']:
+        """
+        Read word memory (%R, %AI or %AQ).
+
+        Shared implementation of read_register, read_analog_input and
+        read_analog_output, which only differ in segment selector.
+
+        Args:
+            description: Memory name for logging (e.g. 'register')
+            prefix: Memory type prefix (e.g. 'R' for %R)
+            address: Starting address
+            count: Number of consecutive values to read
+            as_array: Return an array('h') of all values instead of an int or list
+            number_base: Added to address in log messages (1 for %AI/%AQ)
+
+        Returns:
+            Depends on count and as_array (see read_register)
+        """
+        if count < 1 or count > 125:
+            raise exceptions.ValidationError(f"Count must be 1-125, got {count}")
+
+        logger.info("Reading %s %%%s%s, count=%s", description, prefix, address + number_base, count)
+
+        # PLC requires minimum data_length of 4 words (8 bytes)
+        # Request at least 4, but return only what was asked for
+        response = self._send_request_and_receive(
+            service_code=protocol.ServiceCode.READ_SYSTEM_MEMORY,
+            segment_selector=_SELECTORS[(prefix, 'word')],
+            data_offset=address,
+            data_length=max(count, _MIN_REQUEST_LENGTH['word'])
+        )
+
+        if count == 1 and not as_array:
+            return response.extract_first_word()
+
+        if as_array:
+            values = response.extract_word_array()
+        else:
+            values = response.extract_word_values()
+
+        # Return only the requested number of values; trimming in place is
+        # a no-op when the PLC returned exactly count words (count >= 4)
+        del values[count:]
+
+        if as_array:
+            return values
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Read %s %%%s%s-%s: %s", description, prefix, address + number_base,
+                         address + number_base + count - 1, values)
+
+        return values
+
+    def read_register(
+        self,
+        address: int,
+        count: int = 1,
+        as_array: bool = False
+    ) -> Union[int, List[int], 'array.array[int]']:
         """
         Read one or more register values (%R memory).
 
@@ -185,9 +458,11 @@ class GE_SRTP_Driver:
         Args:
             address: Starting register address (e.g., 100 for %R100)
             count: Number of consecutive registers to read (default 1)
+            as_array: Return an array('h') of all values instead of an int or list
 
         Returns:
             Single integer if count=1, list of integers otherwise
+            (array('h') of count values if as_array is True)
 
         Raises:
             ValidationError: If address or count is invalid
@@ -199,36 +474,104 @@ class GE_SRTP_Driver:
             values = plc.read_register(100, 10)  # Read %R100-R109
             ```
         """
+        return self._read_words('register', 'R', address, count, as_array)
+
+    def read_register_into(self, buffer, address: int, count: Optional[int] = None):
+        """
+        Read register values (%R memory) into a caller-supplied buffer.
+
+        Same as read_register(), but the values are stored into an existing
+        mutable sequence (e.g. array.array('h') or a list) instead of a new
+        list, so polling loops can reuse the same buffers every cycle.
+
+        Args:
+            buffer: Mutable sequence to receive the values, starting at index 0
+            address: Starting register address (e.g., 100 for %R100)
+            count: Number of consecutive registers to read (default len(buffer))
+
+        Returns:
+            The buffer that was filled
+
+        Raises:
+            ValidationError: If address or count is invalid
+            MemoryError: If read operation fails
+
+        Example:
+            ```python
+            buf = array.array('h', bytes(20))
+            plc.read_register_into(buf, 100)  # Fill buf with %R100-R109
+            ```
+        """
+        if count is None:
+            count = len(buffer)
+
+        if count > len(buffer):
+            raise exceptions.ValidationError(
+                f"Buffer holds {len(buffer)} values, cannot read {count}"
+            )
+
+        payload = self.read_register_raw(address, count)
+
+        if _NATIVE_WORDS and isinstance(buffer, array.array) and buffer.typecode == 'h':
+            # Same memory layout: copy the raw words, no int per value
+            memoryview(buffer)[:count] = memoryview(payload).cast('h')
+        else:
+            # Unpack little-endian 16-bit signed words straight into the buffer
+            for i, value in enumerate(_WORD_STRUCTS[count].unpack_from(payload)):
+                buffer[i] = value
+
+        return buffer
+
+    def read_register_raw(self, address: int, count: int = 1) -> bytes:
+        """
+        Read register memory (%R) as undecoded bytes.
+
+        Returns the response payload as-is: `count` 16-bit signed words in
+        little-endian order (2 bytes per register). Useful when the caller
+        decodes in bulk, e.g. with array.array('h').frombytes().
+
+        Args:
+            address: Starting register address (e.g., 100 for %R100)
+            count: Number of consecutive registers to read (default 1)
+
+        Returns:
+            count * 2 bytes of register data
+
+        Raises:
+            ValidationError: If address or count is invalid
+            MemoryError: If read operation fails
+        """
         if count < 1 or count > 125:
             raise exceptions.ValidationError(f"Count must be 1-125, got {count}")
 
-        logger.info(f"Reading register %R{address}, count={count}")
+        logger.info("Reading raw register %%R%s, count=%s", address, count)
 
         # PLC requires minimum data_length of 4 words (8 bytes)
-        # Request at least 4, but return only what was asked for
-        request_length = max(count, 4)
-
         response = self._send_request_and_receive(
             service_code=protocol.ServiceCode.READ_SYSTEM_MEMORY,
-            segment_selector=protocol.SegmentSelector.REGISTERS_WORD,
+            segment_selector=_SELECTORS[('R', 'word')],
             data_offset=address,
-            data_length=request_length
+            data_length=max(count, _MIN_REQUEST_LENGTH['word'])
         )
 
-        values = response.extract_word_values()
-
-        # Return only the requested number of values
-        values = values[:count]
-
-        logger.debug(f"Read registers %R{address}-{address+count-1}: {values}")
+        payload = response.extract_data_payload()
+        if len(payload) < count * 2:
+            raise exceptions.InvalidResponseError(
+                f"Payload length {len(payload)} too short for {count} registers"
+            )
 
-        return values[0] if count == 1 else values
+        return payload[:count * 2]
 
     # ========================================================================
     # ANALOG I/O OPERATIONS (%AI, %AQ)
     # ========================================================================
 
-    def read_analog_input(self, address: int, count: int = 1) -> Union[int, List[int]]:
+    def read_analog_input(
+        self,
+        address: int,
+        count: int = 1,
+        as_array: bool = False
+    ) -> Union[int, List[int], 'array.array[int]']:
         """
         Read analog input values (%AI memory).
 
@@ -238,33 +581,20 @@ class GE_SRTP_Driver:
         Args:
             address: Starting address (e.g., 0 for %AI1, note: 0-based addressing)
             count: Number of consecutive values to read
+            as_array: Return an array('h') of all values instead of an int or list
 
         Returns:
             Single integer if count=1, list of integers otherwise
+            (array('h') of count values if as_array is True)
         """
-        if count < 1 or count > 125:
-            raise exceptions.ValidationError(f"Count must be 1-125, got {count}")
-
-        logger.info(f"Reading analog input %AI{address+1}, count={count}")
-
-        # PLC requires minimum data_length of 4 words
-        request_length = max(count, 4)
-
-        response = self._send_request_and_receive(
-            service_code=protocol.ServiceCode.READ_SYSTEM_MEMORY,
-            segment_selector=protocol.SegmentSelector.ANALOG_INPUTS_WORD,
-            data_offset=address,
-            data_length=request_length
-        )
-
-        values = response.extract_word_values()
-
-        # Return only the requested number of values
-        values = values[:count]
+        return self._read_words('analog input', 'AI', address, count, as_array, number_base=1)
 
-        return values[0] if count == 1 else values
-
-    def read_analog_output(self, address: int, count: int = 1) -> Union[int, List[int]]:
+    def read_analog_output(
+        self,
+        address: int,
+        count: int = 1,
+        as_array: bool = False
+    ) -> Union[int, List[int], 'array.array[int]']:
         """
         Read analog output values (%AQ memory).
 
@@ -274,35 +604,69 @@ class GE_SRTP_Driver:
         Args:
             address: Starting address (e.g., 0 for %AQ1, note: 0-based addressing)
             count: Number of consecutive values to read
+            as_array: Return an array('h') of all values instead of an int or list
 
         Returns:
             Single integer if count=1, list of integers otherwise
+            (array('h') of count values if as_array is True)
         """
-        if count < 1 or count > 125:
-            raise exceptions.ValidationError(f"Count must be 1-125, got {count}")
+        return self._read_words('analog output', 'AQ', address, count, as_array, number_base=1)
 
-        logger.info(f"Reading analog output %AQ{address+1}, count={count}")
+    # ========================================================================
+    # DISCRETE I/O OPERATIONS (%I, %Q)
+    # ========================================================================
+
+    def _read_discrete(
+        self,
+        description: str,
+        prefix: str,
+        address: int,
+        count: int,
+        mode: str
+    ) -> Union[bool, List[bool], int, List[int]]:
+        """
+        Read discrete memory in bit or byte mode.
 
-        # PLC requires minimum data_length of 4 words
-        request_length = max(count, 4)
+        Shared implementation of the read_discrete_*, read_system_memory and
+        read_global_memory methods, which only differ in segment selectors.
+
+        Args:
+            description: Memory name for logging (e.g. 'discrete input')
+            prefix: Memory type prefix (e.g. 'I' for %I)
+            address: Starting address
+            count: Number of values to read
+            mode: 'bit' for boolean values, 'byte' for byte values
+
+        Returns:
+            Depends on mode and count (see read_discrete_input)
+        """
+        if mode not in ('bit', 'byte'):
+            raise exceptions.ValidationError(f"Invalid mode: {mode}, must be 'bit' or 'byte'")
+
+        selector = _SELECTORS[(prefix, mode)]
+        request_length = max(count, _MIN_REQUEST_LENGTH[mode])
+
+        logger.info("Reading %s %%%s%s, count=%s, mode=%s", description, prefix, address, count, mode)
 
         response = self._send_request_and_receive(
             service_code=protocol.ServiceCode.READ_SYSTEM_MEMORY,
-            segment_selector=protocol.SegmentSelector.ANALOG_OUTPUTS_WORD,
+            segment_selector=selector,
             data_offset=address,
             data_length=request_length
         )
 
-        values = response.extract_word_values()
+        if count == 1:
+            # Single value: decode the first byte only
+            first = response.extract_first_byte()
+            return bool(first & 1) if mode == 'bit' else first
 
-        # Return only the requested number of values
-        values = values[:count]
+        if mode == 'bit':
+            values = response.extract_bit_values(count)
+        else:  # byte
+            values = response.extract_byte_values()
+            del values[count:]  # Trim to requested count in place
 
-        return values[0] if count == 1 else values
-
-    # ========================================================================
-    # DISCRETE I/O OPERATIONS (%I, %Q)
-    # ========================================================================
+        return values
 
     def read_discrete_input(
         self,
@@ -328,33 +692,7 @@ class GE_SRTP_Driver:
             - mode='byte', count=1: single integer (0-255)
             - mode='byte', count>1: list of integers
         """
-        if mode == 'bit':
-            selector = protocol.SegmentSelector.DISCRETE_INPUTS_BIT
-            logger.info(f"Reading discrete input %I{address}, count={count}, mode=bit")
-            # For bit mode, enforce minimum of 64 bits (8 bytes) - verified on RX3i
-            request_length = max(count, 64)
-        elif mode == 'byte':
-            selector = protocol.SegmentSelector.DISCRETE_INPUTS_BYTE
-            logger.info(f"Reading discrete input %I{address}, count={count}, mode=byte")
-            # For byte mode, enforce minimum of 8 bytes - verified on RX3i
-            request_length = max(count, 8)
-        else:
-            raise exceptions.ValidationError(f"Invalid mode: {mode}, must be 'bit' or 'byte'")
-
-        response = self._send_request_and_receive(
-            service_code=protocol.ServiceCode.READ_SYSTEM_MEMORY,
-            segment_selector=selector,
-            data_offset=address,
-            data_length=request_length
-        )
-
-        if mode == 'bit':
-            values = response.extract_bit_values(count)
-            return values[0] if count == 1 else values
-        else:  # byte
-            values = response.extract_byte_values()
-            values = values[:count]  # Trim to requested count
-            return values[0] if count == 1 else values
+        return self._read_discrete('discrete input', 'I', address, count, mode)
 
     def read_discrete_output(
         self,
@@ -376,33 +714,7 @@ class GE_SRTP_Driver:
         Returns:
             Depends on mode and count (see read_discrete_input)
         """
-        if mode == 'bit':
-            selector = protocol.SegmentSelector.DISCRETE_OUTPUTS_BIT
-            # For bit mode, enforce minimum of 64 bits (8 bytes) - verified on RX3i
-            request_length = max(count, 64)
-        elif mode == 'byte':
-            selector = protocol.SegmentSelector.DISCRETE_OUTPUTS_BYTE
-            # For byte mode, enforce minimum of 8 bytes - verified on RX3i
-            request_length = max(count, 8)
-        else:
-            raise exceptions.ValidationError(f"Invalid mode: {mode}")
-
-        logger.info(f"Reading discrete output %Q{address}, count={count}, mode={mode}")
-
-        response = self._send_request_and_receive(
-            service_code=protocol.ServiceCode.READ_SYSTEM_MEMORY,
-            segment_selector=selector,
-            data_offset=address,
-            data_length=request_length
-        )
-
-        if mode == 'bit':
-            values = response.extract_bit_values(count)
-            return values[0] if count == 1 else values
-        else:
-            values = response.extract_byte_values()
-            values = values[:count]  # Trim to requested count
-            return values[0] if count == 1 else values
+        return self._read_discrete('discrete output', 'Q', address, count, mode)
 
     # ========================================================================
     # INTERNAL/TEMPORARY MEMORY OPERATIONS (%M, %T)
@@ -427,33 +739,7 @@ class GE_SRTP_Driver:
         Returns:
             Depends on mode and count
         """
-        if mode == 'bit':
-            selector = protocol.SegmentSelector.DISCRETE_INTERNALS_BIT
-            # For bit mode, enforce minimum of 64 bits (8 bytes) - verified on RX3i
-            request_length = max(count, 64)
-        elif mode == 'byte':
-            selector = protocol.SegmentSelector.DISCRETE_INTERNALS_BYTE
-            # For byte mode, enforce minimum of 8 bytes - verified on RX3i
-            request_length = max(count, 8)
-        else:
-            raise exceptions.ValidationError(f"Invalid mode: {mode}")
-
-        logger.info(f"Reading discrete internal %M{address}, count={count}, mode={mode}")
-
-        response = self._send_request_and_receive(
-            service_code=protocol.ServiceCode.READ_SYSTEM_MEMORY,
-            segment_selector=selector,
-            data_offset=address,
-            data_length=request_length
-        )
-
-        if mode == 'bit':
-            values = response.extract_bit_values(count)
-            return values[0] if count == 1 else values
-        else:
-            values = response.extract_byte_values()
-            values = values[:count]  # Trim to requested count
-            return values[0] if count == 1 else values
+        return self._read_discrete('discrete internal', 'M', address, count, mode)
 
     def read_discrete_temp(
         self,
@@ -475,33 +761,7 @@ class GE_SRTP_Driver:
         Returns:
             Depends on mode and count
         """
-        if mode == 'bit':
-            selector = protocol.SegmentSelector.DISCRETE_TEMPS_BIT
-            # For bit mode, enforce minimum of 64 bits (8 bytes) - verified on RX3i
-            request_length = max(count, 64)
-        elif mode == 'byte':
-            selector = protocol.SegmentSelector.DISCRETE_TEMPS_BYTE
-            # For byte mode, enforce minimum of 8 bytes - verified on RX3i
-            request_length = max(count, 8)
-        else:
-            raise exceptions.ValidationError(f"Invalid mode: {mode}")
-
-        logger.info(f"Reading discrete temp %T{address}, count={count}, mode={mode}")
-
-        response = self._send_request_and_receive(
-            service_code=protocol.ServiceCode.READ_SYSTEM_MEMORY,
-            segment_selector=selector,
-            data_offset=address,
-            data_length=request_length
-        )
-
-        if mode == 'bit':
-            values = response.extract_bit_values(count)
-            return values[0] if count == 1 else values
-        else:
-            values = response.extract_byte_values()
-            values = values[:count]  # Trim to requested count
-            return values[0] if count == 1 else values
+        return self._read_discrete('discrete temp', 'T', address, count, mode)
 
     # ========================================================================
     # SYSTEM MEMORY OPERATIONS (%S, %SA, %SB, %SC)
@@ -528,50 +788,11 @@ class GE_SRTP_Driver:
         Returns:
             Depends on mode and count
         """
-        # Map memory type to selector
-        selector_map_bit = {
-            'S': protocol.SegmentSelector.SYSTEM_S_DISCRETE_BIT,
-            'SA': protocol.SegmentSelector.SYSTEM_A_DISCRETE_BIT,
-            'SB': protocol.SegmentSelector.SYSTEM_B_DISCRETE_BIT,
-            'SC': protocol.SegmentSelector.SYSTEM_C_DISCRETE_BIT,
-        }
-        selector_map_byte = {
-            'S': protocol.SegmentSelector.SYSTEM_S_DISCRETE_BYTE,
-            'SA': protocol.SegmentSelector.SYSTEM_A_DISCRETE_BYTE,
-            'SB': protocol.SegmentSelector.SYSTEM_B_DISCRETE_BYTE,
-            'SC': protocol.SegmentSelector.SYSTEM_C_DISCRETE_BYTE,
-        }
-
-        if mode == 'bit':
-            selector = selector_map_bit.get(mem_type.upper())
-            # For bit mode, enforce minimum of 64 bits (8 bytes) - verified on RX3i
-            request_length = max(count, 64)
-        elif mode == 'byte':
-            selector = selector_map_byte.get(mem_type.upper())
-            # For byte mode, enforce minimum of 8 bytes - verified on RX3i
-            request_length = max(count, 8)
-        else:
-            raise exceptions.ValidationError(f"Invalid mode: {mode}")
-
-        if selector is None:
+        prefix = mem_type.upper()
+        if prefix not in _SYSTEM_MEMORY_TYPES:
             raise exceptions.ValidationError(f"Invalid system memory type: {mem_type}")
 
-        logger.info(f"Reading system memory %{mem_type}{address}, count={count}, mode={mode}")
-
-        response = self._send_request_and_receive(
-            service_code=protocol.ServiceCode.READ_SYSTEM_MEMORY,
-            segment_selector=selector,
-            data_offset=address,
-            data_length=request_length
-        )
-
-        if mode == 'bit':
-            values = response.extract_bit_values(count)
-            return values[0] if count == 1 else values
-        else:
-            values = response.extract_byte_values()
-            values = values[:count]  # Trim to requested count
-            return values[0] if count == 1 else values
+        return self._read_discrete('system memory', prefix, address, count, mode)
 
     # ========================================================================
     # GENIUS GLOBAL DATA (%G)
@@ -596,33 +817,207 @@ class GE_SRTP_Driver:
         Returns:
             Depends on mode and count
         """
-        if mode == 'bit':
-            selector = protocol.SegmentSelector.GENIUS_GLOBAL_DATA_BIT
-            # For bit mode, enforce minimum of 64 bits (8 bytes) - verified on RX3i
-            request_length = max(count, 64)
-        elif mode == 'byte':
-            selector = protocol.SegmentSelector.GENIUS_GLOBAL_DATA_BYTE
-            # For byte mode, enforce minimum of 8 bytes - verified on RX3i
-            request_length = max(count, 8)
-        else:
-            raise exceptions.ValidationError(f"Invalid mode: {mode}")
+        return self._read_discrete('global memory', 'G', address, count, mode)
 
-        logger.info(f"Reading global memory %G{address}, count={count}, mode={mode}")
+    # ========================================================================
+    # BATCH OPERATIONS
+    # ========================================================================
 
-        response = self._send_request_and_receive(
-            service_code=protocol.ServiceCode.READ_SYSTEM_MEMORY,
-            segment_selector=selector,
-            data_offset=address,
-            data_length=request_length
-        )
+    def read_batch(
+        self,
+        requests: List[Tuple],
+        pipeline: bool = True,
+        as_array: bool = False
+    ) -> List[Union[list, array.array]]:
+        """
+        Read several memory ranges with as few round trips as possible.
 
-        if mode == 'bit':
-            values = response.extract_bit_values(count)
-            return values[0] if count == 1 else values
+        Requests for the same memory type and access mode whose address
+        ranges overlap or touch are merged into one read. The remaining
+        reads are pipelined: all requests are sent back-to-back and the
+        responses are then received in order, so the whole batch costs
+        about one network round trip. With concurrency > 1 the reads are
+        split across the pooled connections and pipelined on each of them
+        in parallel.
+
+        Args:
+            requests: (memory_type, address, count) or
+                (memory_type, address, count, mode) tuples. memory_type is
+                'R', 'AI', 'AQ', 'I', 'Q', 'M', 'T', 'S', 'SA', 'SB', 'SC'
+                or 'G'. mode ('bit' or 'byte', default 'bit') applies to
+                discrete memory only; %R, %AI and %AQ are always read as words.
+            pipeline: Send all requests before reading any response
+                (default True). Set False for a PLC that only accepts one
+                outstanding request per connection.
+            as_array: Return %R, %AI and %AQ values as array('h') instead
+                of lists, which avoids one int object per word for large
+                ranges (default False)
+
+        Returns:
+            One list of values per request, in request order (array('h')
+            for word requests if as_array is True)
+
+        Raises:
+            ValidationError: If a memory type, mode or count is invalid
+            MemoryError: If a read operation fails
+
+        Example:
+            ```python
+            regs, inputs, flags = plc.read_batch([
+                ('R', 0, 10),      # %R1-R10
+                ('I', 0, 16),      # %I1-I16 as booleans
+                ('M', 0, 4, 'byte'),
+            ])
+            ```
+        """
+        # Resolve every request to (selector, mode, address, count)
+        specs = []
+        for request in requests:
+            mem_type, address, count = request[:3]
+            name = mem_type.upper().lstrip('%')
+
+            if name not in _MEMORY_TYPES:
+                raise exceptions.ValidationError(f"Invalid memory type: {mem_type}")
+
+            if name in _WORD_MEMORY_TYPES:
+                mode = 'word'
+            else:
+                mode = request[3] if len(request) > 3 else 'bit'
+                if mode not in ('bit', 'byte'):
+                    raise exceptions.ValidationError(
+                        f"Invalid mode: {mode}, must be 'bit' or 'byte'"
+                    )
+
+            max_span = _MAX_SPAN[mode]
+            if count < 1 or count > max_span:
+                raise exceptions.ValidationError(
+                    f"Count must be 1-{max_span} for {mode} access, got {count}"
+                )
+
+            specs.append((_SELECTORS[(name, mode)], mode, address, count))
+
+        # Coalesce overlapping/adjacent ranges: [selector, mode, start, end, indices]
+        spans = []
+        for i in sorted(range(len(specs)), key=lambda i: (specs[i][0], specs[i][2])):
+            selector, mode, address, count = specs[i]
+            end = address + count
+            if spans:
+                last = spans[-1]
+                if (last[0] == selector and address <= last[3]
+                        and max(end, last[3]) - last[2] <= _MAX_SPAN[mode]):
+                    last[3] = max(last[3], end)
+                    last[4].append(i)
+                    continue
+            spans.append([selector, mode, address, end, [i]])
+
+        logger.info("Reading batch of %d requests as %d reads", len(specs), len(spans))
+
+        reads = [
+            (protocol.ServiceCode.READ_SYSTEM_MEMORY, selector, start,
+             max(end - start, _MIN_REQUEST_LENGTH[mode]))
+            for selector, mode, start, end, _ in spans
+        ]
+        if not pipeline:
+            responses = [self._send_request_and_receive(*read) for read in reads]
+        elif self.concurrency > 1 and len(reads) > 1:
+            # Split the reads into one contiguous chunk per pooled connection
+            # and pipeline the chunks side by side; concatenating the chunk
+            # results keeps request order
+            size = -(-len(reads) // self.concurrency)
+            chunks = [reads[i:i + size] for i in range(0, len(reads), size)]
+            with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+                responses = [
+                    response
+                    for chunk_responses in executor.map(self._send_requests_and_receive, chunks)
+                    for response in chunk_responses
+                ]
         else:
-            values = response.extract_byte_values()
-            values = values[:count]  # Trim to requested count
-            return values[0] if count == 1 else values
+            responses = self._send_requests_and_receive(reads)
+
+        # Slice each merged response back into the callers' ranges
+        results = [None] * len(specs)
+        for (selector, mode, start, end, indices), response in zip(spans, responses):
+            if mode == 'word':
+                if as_array:
+                    values = response.extract_word_array()
+                else:
+                    values = response.extract_word_values()
+            elif mode == 'bit':
+                values = response.extract_bit_values(end - start)
+            else:
+                values = response.extract_byte_values()
+
+            for i in indices:
+                offset = specs[i][2] - start
+                results[i] = values[offset:offset + specs[i][3]]
+
+        return results
+
+    def acquire_all(
+        self,
+        plan: List[Tuple],
+        as_array: bool = False
+    ) -> Dict[Tuple, Union[list, array.array]]:
+        """
+        Read whole memory regions of any size as fast as the PLC allows.
+
+        Each region is split into the largest reads the protocol permits and
+        all reads go through read_batch(), so they are pipelined and, with
+        concurrency > 1, spread across the pooled connections in parallel.
+
+        Args:
+            plan: (memory_type, address, count) or
+                (memory_type, address, count, mode) tuples as for read_batch(),
+                except that count is not limited to a single read
+            as_array: Return %R, %AI and %AQ values as array('h') (default False)
+
+        Returns:
+            Dictionary mapping each plan tuple to its values
+
+        Raises:
+            ValidationError: If a memory type, mode or count is invalid
+            MemoryError: If a read operation fails
+
+        Example:
+            ```python
+            plc = GE_SRTP_Driver('172.16.12.124', slot=0, concurrency=4)
+            plc.connect()
+            data = plc.acquire_all([('R', 0, 16000), ('AI', 0, 64), ('I', 0, 512)])
+            registers = data[('R', 0, 16000)]
+            ```
+        """
+        # Split every region into reads of at most _MAX_SPAN values
+        requests = []
+        parts = []
+        for spec in plan:
+            mem_type, address, count = spec[:3]
+            name = mem_type.upper().lstrip('%')
+            mode = 'word' if name in _WORD_MEMORY_TYPES else (spec[3] if len(spec) > 3 else 'bit')
+            if mode not in _MAX_SPAN:
+                raise exceptions.ValidationError(f"Invalid mode: {mode}, must be 'bit' or 'byte'")
+            max_span = _MAX_SPAN[mode]
+
+            if count < 1:
+                raise exceptions.ValidationError(f"Count must be at least 1, got {count}")
+
+            first = len(requests)
+            for start in range(address, address + count, max_span):
+                chunk = min(max_span, address + count - start)
+                requests.append((mem_type, start, chunk) + tuple(spec[3:4]))
+            parts.append((spec, first, len(requests)))
+
+        logger.info("Acquiring %d regions as %d reads", len(plan), len(requests))
+
+        results = self.read_batch(requests, as_array=as_array)
+
+        acquired = {}
+        for spec, first, last in parts:
+            values = results[first]
+            for more in results[first + 1:last]:
+                values.extend(more)
+            acquired[spec] = values
+
+        return acquired
 
     # ========================================================================
     # PLC STATUS AND DIAGNOSTIC OPERATIONS
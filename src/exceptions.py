@@ -151,6 +151,19 @@ class ValidationError(SRTPException):
     pass
 
 
+# Exception class per PLC error code; other codes map to PLCError
+_ERROR_CODE_EXCEPTIONS = {
+    0x01: ServiceCodeError,
+    0x02: SegmentSelectorError,
+    0x03: InvalidAddressError,
+    0x04: MemoryRangeError,
+    0x05: InsufficientPrivilegeError,
+    0x06: PLCInRunModeError,
+    0x07: MemoryProtectError,
+    0x08: TimeoutError,
+}
+
+
 def error_code_to_exception(error_code: int, message: str = "") -> PLCError:
     """
     Convert a PLC error code to the appropriate exception class.
@@ -162,18 +175,7 @@ def error_code_to_exception(error_code: int, message: str = "") -> PLCError:
     Returns:
         Appropriate exception instance
     """
-    error_mapping = {
-        0x01: ServiceCodeError,
-        0x02: SegmentSelectorError,
-        0x03: InvalidAddressError,
-        0x04: MemoryRangeError,
-        0x05: InsufficientPrivilegeError,
-        0x06: PLCInRunModeError,
-        0x07: MemoryProtectError,
-        0x08: TimeoutError,
-    }
-
-    exception_class = error_mapping.get(error_code, PLCError)
+    exception_class = _ERROR_CODE_EXCEPTIONS.get(error_code, PLCError)
 
     if not message:
         message = f"PLC error code: 0x{error_code:02X}"
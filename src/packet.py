@@ -49,10 +49,14 @@ Packet Structure (56 bytes):
     Bytes 48-55: Reserved (0x00)
 """
 
+import sys
+import array
 import struct
 import logging
+import time
 from datetime import datetime
-from typing import Optional, Tuple
+from itertools import chain
+from typing import Optional, Tuple, Union
 
 from . import protocol
 from . import exceptions
@@ -60,6 +64,55 @@ from . import exceptions
 
 logger = logging.getLogger(__name__)
 
+# 56-byte request header, all fields little-endian:
+#   0 packet type, 2 sequence number, 4 text length, 9 and 17 reserved (0x01),
+#   26-28 timestamp (seconds, minutes, hours), 30 sequence number (duplicate),
+#   31 message type, 32-35 mailbox source, 36-39 mailbox destination,
+#   40 packet number, 41 total packets, 42 service request code,
+#   43 segment selector, 44-45 data offset, 46-47 data length
+# All other bytes are reserved and zero.
+_REQUEST_HEADER = struct.Struct('<BxBxB4xB7xB8xBBBxBB4s4sBBBBHH8x')
+
+# Response header fields read by parse_response(): packet type (0),
+# sequence number (2), message type (31), service code (42),
+# segment selector (43), data offset (44-45), data length (46-47)
+_RESPONSE_HEADER = struct.Struct('<BxB28xB10xBBHH')
+
+# Header values checked on every response, as plain ints so the checks
+# skip the enum attribute lookups
+_RESPONSE_TYPE = int(protocol.PacketType.RESPONSE)
+_ERROR_MESSAGE = int(protocol.MessageType.ERROR)
+_SUCCESS_MESSAGES = frozenset({int(protocol.MessageType.ACK), int(protocol.MessageType.ACK_WITH_DATA)})
+
+# (epoch second, bytes([second, minute, hour])) of the last request
+# timestamp. Requests only carry whole seconds, so the local time is
+# worked out at most once per second instead of once per request
+_timestamp_cache = (-1, bytes(3))
+
+
+def _request_timestamp() -> bytes:
+    """
+    Get the current local time as request timestamp bytes 26-28.
+
+    Returns:
+        bytes([second, minute, hour])
+    """
+    global _timestamp_cache
+    epoch_second = int(time.time())
+    cached_second, timestamp = _timestamp_cache
+    if epoch_second != cached_second:
+        now = datetime.fromtimestamp(epoch_second)
+        timestamp = bytes((now.second, now.minute, now.hour))
+        _timestamp_cache = (epoch_second, timestamp)
+    return timestamp
+
+
+# Bit values of every possible byte, least significant bit first
+_BYTE_BITS = tuple(
+    tuple(bool(byte_val & (1 << bit_idx)) for bit_idx in range(8))
+    for byte_val in range(256)
+)
+
 
 class SRTPPacket:
     """
@@ -69,6 +122,12 @@ class SRTPPacket:
     packets according to the 56-byte SRTP protocol specification.
     """
 
+    # One instance per response; no per-instance __dict__ needed
+    __slots__ = (
+        'packet_type', 'sequence_number', 'message_type', 'service_code',
+        'segment_selector', 'data_offset', 'data_length', 'payload', 'timestamp',
+    )
+
     def __init__(self):
         """Initialize an SRTP packet."""
         self.packet_type: int = protocol.PacketType.REQUEST
@@ -116,103 +175,74 @@ class SRTPPacket:
             raise exceptions.ValidationError(f"Data offset must be 0-65535, got {data_offset}")
         if not (0 <= data_length <= 65535):
             raise exceptions.ValidationError(f"Data length must be 0-65535, got {data_length}")
+        if not (0 <= service_code <= 255):
+            raise exceptions.ValidationError(f"Service code must be 0-255, got {service_code}")
+        if not (0 <= segment_selector <= 255):
+            raise exceptions.ValidationError(f"Segment selector must be 0-255, got {segment_selector}")
 
         # Get current time
-        now = datetime.now()
-
-        # Build 56-byte header
-        packet = bytearray(protocol.HEADER_SIZE)
-
-        # Byte 0: Packet type
-        packet[0] = protocol.PacketType.REQUEST
-
-        # Byte 1: Reserved
-        packet[1] = 0x00
-
-        # Byte 2: Sequence number
-        packet[2] = sequence_number & 0xFF
-
-        # Byte 3: Reserved
-        packet[3] = 0x00
-
-        # Byte 4: Text length
-        packet[4] = 0x00
-
-        # Bytes 5-8: Reserved
-        packet[5:9] = bytes([0x00] * 4)
-
-        # Byte 9: Reserved (0x01)
-        packet[9] = 0x01
-
-        # Bytes 10-16: Reserved
-        packet[10:17] = bytes([0x00] * 7)
-
-        # Byte 17: Reserved (0x01)
-        packet[17] = 0x01
-
-        # Bytes 18-25: Reserved
-        packet[18:26] = bytes([0x00] * 8)
-
-        # Bytes 26-28: Timestamp (seconds, minutes, hours)
-        packet[26] = now.second
-        packet[27] = now.minute
-        packet[28] = now.hour
-
-        # Byte 29: Reserved
-        packet[29] = 0x00
-
-        # Byte 30: Sequence number (duplicate)
-        packet[30] = sequence_number & 0xFF
-
-        # Byte 31: Message type
-        packet[31] = protocol.MessageType.REQUEST
-
-        # Bytes 32-35: Mailbox source
-        packet[32:36] = protocol.MAILBOX_SOURCE
-
-        # Bytes 36-39: Mailbox destination (slot-specific)
-        packet[36:40] = protocol.get_mailbox_destination(slot)
-
-        # Byte 40: Packet number (1-indexed)
-        packet[40] = 0x01
-
-        # Byte 41: Total packets
-        packet[41] = 0x01
-
-        # Byte 42: Service request code
-        packet[42] = service_code & 0xFF
+        second, minute, hour = _request_timestamp()
+
+        # Build 56-byte header in one pack (layout in _REQUEST_HEADER)
+        header = _REQUEST_HEADER.pack(
+            protocol.PacketType.REQUEST,
+            sequence_number,
+            0x00,                                 # Text length
+            0x01,                                 # Reserved (byte 9)
+            0x01,                                 # Reserved (byte 17)
+            second,
+            minute,
+            hour,
+            sequence_number,                      # Sequence number (duplicate)
+            protocol.MessageType.REQUEST,
+            protocol.MAILBOX_SOURCE,
+            protocol.get_mailbox_destination(slot),
+            0x01,                                 # Packet number (1-indexed)
+            0x01,                                 # Total packets
+            service_code,
+            segment_selector,
+            data_offset,
+            data_length
+        )
 
-        # Byte 43: Segment selector
-        packet[43] = segment_selector & 0xFF
+        # Append payload if present
+        full_packet = header + payload
 
-        # Bytes 44-45: Data offset (little-endian)
-        packet[44] = data_offset & 0xFF        # LSB
-        packet[45] = (data_offset >> 8) & 0xFF  # MSB
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Built request packet: seq=%d, service=0x%02X, selector=0x%02X, offset=%d, length=%d",
+                sequence_number, service_code, segment_selector, data_offset, data_length
+            )
 
-        # Bytes 46-47: Data length (little-endian)
-        packet[46] = data_length & 0xFF        # LSB
-        packet[47] = (data_length >> 8) & 0xFF  # MSB
+        return full_packet
 
-        # Bytes 48-55: Reserved
-        packet[48:56] = bytes([0x00] * 8)
+    @staticmethod
+    def restamp_request(template: bytes, sequence_number: int) -> bytearray:
+        """
+        Copy a prebuilt request header with a new sequence number and timestamp.
 
-        # Append payload if present
-        full_packet = bytes(packet) + payload
+        Lets callers that repeat the same request build it once with
+        build_request() and only refresh the per-request fields.
 
-        logger.debug(
-            f"Built request packet: seq={sequence_number}, service=0x{service_code:02X}, "
-            f"selector=0x{segment_selector:02X}, offset={data_offset}, length={data_length}"
-        )
+        Args:
+            template: 56-byte request header from build_request()
+            sequence_number: Packet sequence number (0-255)
 
-        return full_packet
+        Returns:
+            Request header ready to send
+        """
+        packet = bytearray(template)
+        packet[2] = packet[30] = sequence_number & 0xFF
+        packet[26:29] = _request_timestamp()
+        return packet
 
     @staticmethod
-    def parse_response(data: bytes) -> 'SRTPPacket':
+    def parse_response(data: Union[bytes, memoryview]) -> 'SRTPPacket':
         """
         Parse an SRTP response packet.
 
         Args:
-            data: Raw packet data (minimum 56 bytes)
+            data: Raw packet data (minimum 56 bytes), as bytes or a view
 
         Returns:
             SRTPPacket object with parsed fields
@@ -229,27 +259,23 @@ class SRTPPacket:
 
         packet = SRTPPacket()
 
-        # Parse header fields
-        packet.packet_type = data[0]
-        packet.sequence_number = data[2]
-        packet.message_type = data[31]
-        packet.service_code = data[42]
-        packet.segment_selector = data[43]
-
-        # Parse data offset (little-endian)
-        packet.data_offset = data[44] | (data[45] << 8)
-
-        # Parse data length (little-endian)
-        packet.data_length = data[46] | (data[47] << 8)
+        # Parse header fields (data offset and length are little-endian)
+        (packet.packet_type,
+         packet.sequence_number,
+         packet.message_type,
+         packet.service_code,
+         packet.segment_selector,
+         packet.data_offset,
+         packet.data_length) = _RESPONSE_HEADER.unpack_from(data)
 
         # Validate packet type
-        if packet.packet_type != protocol.PacketType.RESPONSE:
+        if packet.packet_type != _RESPONSE_TYPE:
             raise exceptions.InvalidPacketError(
                 f"Expected response packet (0x03), got 0x{packet.packet_type:02X}"
             )
 
         # Check message type
-        if packet.message_type == protocol.MessageType.ERROR:
+        if packet.message_type == _ERROR_MESSAGE:
             # Extract error code if available in payload
             error_code = data[56] if len(data) > 56 else 0
             raise exceptions.error_code_to_exception(
@@ -258,23 +284,21 @@ class SRTPPacket:
             )
 
         # Accept both ACK (0xD4) and ACK_WITH_DATA (0x94) as successful responses
-        if packet.message_type not in (protocol.MessageType.ACK, protocol.MessageType.ACK_WITH_DATA):
+        if packet.message_type not in _SUCCESS_MESSAGES:
             logger.warning(
-                f"Unexpected message type: 0x{packet.message_type:02X} "
-                f"(expected ACK 0xD4 or ACK_WITH_DATA 0x94)"
+                "Unexpected message type: 0x%02X (expected ACK 0xD4 or ACK_WITH_DATA 0x94)",
+                packet.message_type
             )
 
-        # Extract payload (data beyond 56-byte header)
-        if len(data) > protocol.HEADER_SIZE:
-            packet.payload = data[protocol.HEADER_SIZE:]
-        else:
-            packet.payload = b''
+        # Extract payload (data beyond 56-byte header); bytes() copies it
+        # out when data is a view into a connection's receive buffer
+        packet.payload = bytes(data[protocol.HEADER_SIZE:])
 
-        logger.debug(
-            f"Parsed response: seq={packet.sequence_number}, "
-            f"msg_type=0x{packet.message_type:02X}, "
-            f"payload_len={len(packet.payload)}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Parsed response: seq=%d, msg_type=0x%02X, payload_len=%d",
+                packet.sequence_number, packet.message_type, len(packet.payload)
+            )
 
         return packet
 
@@ -293,12 +317,16 @@ class SRTPPacket:
 
         return self.payload
 
-    def extract_word_values(self) -> list:
+    def extract_word_array(self) -> 'array.array[int]':
         """
-        Extract 16-bit word values from payload (little-endian).
+        Extract 16-bit word values from payload (little-endian) as an array.
+
+        The whole payload is decoded in one call into an array('h'), which
+        stores the values compactly and can be handed to code that works
+        on buffers without creating a Python int per word.
 
         Returns:
-            List of 16-bit signed integers
+            array('h') of 16-bit signed integers
 
         Raises:
             InvalidResponseError: If payload length is not even
@@ -308,13 +336,48 @@ class SRTPPacket:
                 f"Payload length {len(self.payload)} is not a multiple of 2 bytes"
             )
 
-        # Unpack as little-endian 16-bit signed integers
-        word_count = len(self.payload) // 2
-        values = struct.unpack(f'<{word_count}h', self.payload)
+        values = array.array('h')
+        values.frombytes(self.payload)
+        if sys.byteorder != 'little':
+            values.byteswap()
 
-        logger.debug(f"Extracted {word_count} word values: {values}")
+        return values
+
+    def extract_first_word(self) -> int:
+        """
+        Extract only the first 16-bit word from payload (little-endian).
 
-        return list(values)
+        Single-value reads use this instead of decoding the whole payload.
+
+        Returns:
+            First 16-bit signed integer
+
+        Raises:
+            InvalidResponseError: If payload holds less than one word
+        """
+        if len(self.payload) < 2:
+            raise exceptions.InvalidResponseError(
+                f"Payload length {len(self.payload)} too short for a word value"
+            )
+
+        return int.from_bytes(self.payload[:2], 'little', signed=True)
+
+    def extract_word_values(self) -> list:
+        """
+        Extract 16-bit word values from payload (little-endian).
+
+        Returns:
+            List of 16-bit signed integers
+
+        Raises:
+            InvalidResponseError: If payload length is not even
+        """
+        values = self.extract_word_array().tolist()
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Extracted %d word values: %s", len(values), values)
+
+        return values
 
     def extract_byte_values(self) -> list:
         """
@@ -324,9 +387,22 @@ class SRTPPacket:
             List of byte values (0-255)
         """
         values = list(self.payload)
-        logger.debug(f"Extracted {len(values)} byte values")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Extracted %d byte values", len(values))
         return values
 
+    def extract_first_byte(self) -> int:
+        """
+        Extract only the first byte from payload.
+
+        Returns:
+            First byte value (0-255); bit 0 of it is the first bit value
+
+        Raises:
+            InvalidResponseError: If packet has no payload
+        """
+        return self.extract_data_payload()[0]
+
     def extract_bit_values(self, bit_count: int) -> list:
         """
         Extract individual bit values from payload.
@@ -337,17 +413,14 @@ class SRTPPacket:
         Returns:
             List of boolean values
         """
-        bits = []
         byte_count = (bit_count + 7) // 8  # Round up
 
-        for byte_idx in range(min(byte_count, len(self.payload))):
-            byte_val = self.payload[byte_idx]
-            for bit_idx in range(8):
-                if len(bits) >= bit_count:
-                    break
-                bits.append(bool(byte_val & (1 << bit_idx)))
+        # Expand each byte through the lookup table, LSB first, then trim
+        bits = list(chain.from_iterable(map(_BYTE_BITS.__getitem__, self.payload[:byte_count])))
+        del bits[bit_count:]
 
-        logger.debug(f"Extracted {len(bits)} bit values")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Extracted %d bit values", len(bits))
         return bits
 
     def validate_sequence_number(self, expected_seq: int) -> bool:
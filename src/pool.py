@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+gesrtp-py - GE-SRTP PLC Driver
+
+Copyright (c) 2025 Jobe Eli Eastwood
+Houston, TX
+
+A Python driver for communicating with GE PLCs using the SRTP protocol.
+Read-only driver for forensic memory acquisition and PLC monitoring.
+
+Author: Jobe Eli Eastwood <jobeastwood@hotmail.com>
+Project: https://github.com/jobeastwood/gesrtp-py
+License: MIT
+
+---
+
+Connection Pool for GE-SRTP Protocol
+
+Every new SRTPConnection pays a TCP handshake plus the initialization
+packet round trip before its first request. This module keeps released
+connections open so scripts that create many short-lived driver sessions
+against the same PLC reuse warm, already-initialized connections.
+"""
+
+import logging
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, Tuple
+
+from .connection import SRTPConnection
+from . import protocol
+
+
+logger = logging.getLogger(__name__)
+
+
+class SRTPConnectionPool:
+    """
+    Thread-safe pool of initialized SRTP connections keyed by (host, port).
+
+    Example:
+        ```python
+        pool = SRTPConnectionPool(max_size=2)
+
+        for _ in range(10):
+            with GE_SRTP_Driver('172.16.12.127', pool=pool) as plc:
+                print(plc.read_register(0))  # Only the first session connects
+
+        pool.close()
+        ```
+    """
+
+    def __init__(self, max_size: int = 4, timeout: int = protocol.DEFAULT_TIMEOUT):
+        """
+        Initialize an empty pool.
+
+        Args:
+            max_size: Idle connections kept per (host, port) (default 4).
+                Connections released beyond this are closed.
+            timeout: Socket timeout in seconds for new connections (default 5)
+        """
+        self.max_size = max_size
+        self.timeout = timeout
+        self._idle: Dict[Tuple[str, int], Deque[SRTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, host: str, port: int = protocol.DEFAULT_PORT) -> SRTPConnection:
+        """
+        Take an idle connection to host:port, or open a new one.
+
+        Idle connections that are no longer alive are closed and skipped.
+
+        Args:
+            host: PLC IP address or hostname
+            port: TCP port (default 18245)
+
+        Returns:
+            Connected and initialized SRTPConnection
+
+        Raises:
+            ConnectionError: If a new connection fails
+            InitializationError: If the initialization handshake fails
+        """
+        with self._lock:
+            idle = self._idle.get((host, port))
+            while idle:
+                connection = idle.pop()
+                if connection.is_alive():
+                    logger.debug("Reusing pooled connection to %s:%s", host, port)
+                    return connection
+                connection.disconnect()
+
+        # Connect outside the lock so other hosts are not held up
+        connection = SRTPConnection(host, port, self.timeout)
+        connection.connect()
+        return connection
+
+    def release(self, connection: SRTPConnection) -> None:
+        """
+        Return a connection to the pool for reuse.
+
+        Closes the connection instead if it is no longer alive or the pool
+        already holds max_size idle connections to its PLC. A connection
+        whose request timed out has already closed itself, so a response
+        still in flight on it is never read by the next borrower.
+
+        Args:
+            connection: Connection obtained from acquire()
+        """
+        if connection.is_alive():
+            with self._lock:
+                idle = self._idle.setdefault((connection.host, connection.port), deque())
+                if len(idle) < self.max_size:
+                    idle.append(connection)
+                    return
+
+        connection.disconnect()
+
+    @contextmanager
+    def connection(self, host: str, port: int = protocol.DEFAULT_PORT) -> Iterator[SRTPConnection]:
+        """
+        Borrow a connection for the duration of a with block.
+
+        Args:
+            host: PLC IP address or hostname
+            port: TCP port (default 18245)
+
+        Yields:
+            Connected and initialized SRTPConnection
+        """
+        connection = self.acquire(host, port)
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle = [connection for connections in self._idle.values() for connection in connections]
+            self._idle.clear()
+
+        for connection in idle:
+            connection.disconnect()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - close idle connections."""
+        self.close()
+        return False
+
+    def __repr__(self) -> str:
+        """String representation of pool."""
+        with self._lock:
+            idle = sum(len(connections) for connections in self._idle.values())
+        return f"SRTPConnectionPool(max_size={self.max_size}, idle={idle})"
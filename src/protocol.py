@@ -25,6 +25,8 @@ memory acquisition of a GE Fanuc Series 90-30"
 """
 
 from enum import IntEnum
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Final
 
 
@@ -141,6 +143,7 @@ class MemoryType(IntEnum):
 MAILBOX_SOURCE: Final[bytes] = bytes([0x00, 0x00, 0x00, 0x00])
 MAILBOX_DESTINATION: Final[bytes] = bytes([0x10, 0x0E, 0x00, 0x00])  # Default (slot 1)
 
+@lru_cache(maxsize=16)
 def get_mailbox_destination(slot: int = 1) -> bytes:
     """
     Generate mailbox destination address for a specific PLC slot.
@@ -153,7 +156,8 @@ def get_mailbox_destination(slot: int = 1) -> bytes:
 
     Note:
         Format is [rack, slot, port, reserved]
-        For most GE PLCs: rack=0, port=0
+        For most GE PLCs: rack=0, port=0. Results are cached per slot,
+        so every request to a slot shares the same bytes object.
     """
     # GE SRTP mailbox format: rack=0x00, slot=(slot-1)*2+0x0E, port=0x00, reserved=0x00
     # Slot 1: 0x10 0x0E 0x00 0x00 (default)
@@ -230,6 +234,38 @@ def get_memory_type_name(mem_type: MemoryType) -> str:
     return mapping.get(mem_type, "UNKNOWN")
 
 
+# Segment selector per access mode and memory type
+_SEGMENT_SELECTORS: Final = MappingProxyType({
+    'word': MappingProxyType({
+        MemoryType.REGISTER: SegmentSelector.REGISTERS_WORD,
+        MemoryType.ANALOG_INPUT: SegmentSelector.ANALOG_INPUTS_WORD,
+        MemoryType.ANALOG_OUTPUT: SegmentSelector.ANALOG_OUTPUTS_WORD,
+    }),
+    'byte': MappingProxyType({
+        MemoryType.DISCRETE_INPUT: SegmentSelector.DISCRETE_INPUTS_BYTE,
+        MemoryType.DISCRETE_OUTPUT: SegmentSelector.DISCRETE_OUTPUTS_BYTE,
+        MemoryType.DISCRETE_TEMP: SegmentSelector.DISCRETE_TEMPS_BYTE,
+        MemoryType.DISCRETE_INTERNAL: SegmentSelector.DISCRETE_INTERNALS_BYTE,
+        MemoryType.SYSTEM_A: SegmentSelector.SYSTEM_A_DISCRETE_BYTE,
+        MemoryType.SYSTEM_B: SegmentSelector.SYSTEM_B_DISCRETE_BYTE,
+        MemoryType.SYSTEM_C: SegmentSelector.SYSTEM_C_DISCRETE_BYTE,
+        MemoryType.SYSTEM_S: SegmentSelector.SYSTEM_S_DISCRETE_BYTE,
+        MemoryType.GENIUS_GLOBAL: SegmentSelector.GENIUS_GLOBAL_DATA_BYTE,
+    }),
+    'bit': MappingProxyType({
+        MemoryType.DISCRETE_INPUT: SegmentSelector.DISCRETE_INPUTS_BIT,
+        MemoryType.DISCRETE_OUTPUT: SegmentSelector.DISCRETE_OUTPUTS_BIT,
+        MemoryType.DISCRETE_TEMP: SegmentSelector.DISCRETE_TEMPS_BIT,
+        MemoryType.DISCRETE_INTERNAL: SegmentSelector.DISCRETE_INTERNALS_BIT,
+        MemoryType.SYSTEM_A: SegmentSelector.SYSTEM_A_DISCRETE_BIT,
+        MemoryType.SYSTEM_B: SegmentSelector.SYSTEM_B_DISCRETE_BIT,
+        MemoryType.SYSTEM_C: SegmentSelector.SYSTEM_C_DISCRETE_BIT,
+        MemoryType.SYSTEM_S: SegmentSelector.SYSTEM_S_DISCRETE_BIT,
+        MemoryType.GENIUS_GLOBAL: SegmentSelector.GENIUS_GLOBAL_DATA_BIT,
+    }),
+})
+
+
 def get_segment_selector_for_memory_type(
     mem_type: MemoryType,
     access_mode: str = 'word'
@@ -247,53 +283,13 @@ def get_segment_selector_for_memory_type(
     Raises:
         ValueError: If invalid combination of memory type and access mode
     """
-    if access_mode == 'word':
-        mapping = {
-            MemoryType.REGISTER: SegmentSelector.REGISTERS_WORD,
-            MemoryType.ANALOG_INPUT: SegmentSelector.ANALOG_INPUTS_WORD,
-            MemoryType.ANALOG_OUTPUT: SegmentSelector.ANALOG_OUTPUTS_WORD,
-        }
-        if mem_type not in mapping:
-            raise ValueError(
-                f"Memory type {get_memory_type_name(mem_type)} does not support word access"
-            )
-        return mapping[mem_type]
-
-    elif access_mode == 'byte':
-        mapping = {
-            MemoryType.DISCRETE_INPUT: SegmentSelector.DISCRETE_INPUTS_BYTE,
-            MemoryType.DISCRETE_OUTPUT: SegmentSelector.DISCRETE_OUTPUTS_BYTE,
-            MemoryType.DISCRETE_TEMP: SegmentSelector.DISCRETE_TEMPS_BYTE,
-            MemoryType.DISCRETE_INTERNAL: SegmentSelector.DISCRETE_INTERNALS_BYTE,
-            MemoryType.SYSTEM_A: SegmentSelector.SYSTEM_A_DISCRETE_BYTE,
-            MemoryType.SYSTEM_B: SegmentSelector.SYSTEM_B_DISCRETE_BYTE,
-            MemoryType.SYSTEM_C: SegmentSelector.SYSTEM_C_DISCRETE_BYTE,
-            MemoryType.SYSTEM_S: SegmentSelector.SYSTEM_S_DISCRETE_BYTE,
-            MemoryType.GENIUS_GLOBAL: SegmentSelector.GENIUS_GLOBAL_DATA_BYTE,
-        }
-        if mem_type not in mapping:
-            raise ValueError(
-                f"Memory type {get_memory_type_name(mem_type)} does not support byte access"
-            )
-        return mapping[mem_type]
-
-    elif access_mode == 'bit':
-        mapping = {
-            MemoryType.DISCRETE_INPUT: SegmentSelector.DISCRETE_INPUTS_BIT,
-            MemoryType.DISCRETE_OUTPUT: SegmentSelector.DISCRETE_OUTPUTS_BIT,
-            MemoryType.DISCRETE_TEMP: SegmentSelector.DISCRETE_TEMPS_BIT,
-            MemoryType.DISCRETE_INTERNAL: SegmentSelector.DISCRETE_INTERNALS_BIT,
-            MemoryType.SYSTEM_A: SegmentSelector.SYSTEM_A_DISCRETE_BIT,
-            MemoryType.SYSTEM_B: SegmentSelector.SYSTEM_B_DISCRETE_BIT,
-            MemoryType.SYSTEM_C: SegmentSelector.SYSTEM_C_DISCRETE_BIT,
-            MemoryType.SYSTEM_S: SegmentSelector.SYSTEM_S_DISCRETE_BIT,
-            MemoryType.GENIUS_GLOBAL: SegmentSelector.GENIUS_GLOBAL_DATA_BIT,
-        }
-        if mem_type not in mapping:
-            raise ValueError(
-                f"Memory type {get_memory_type_name(mem_type)} does not support bit access"
-            )
-        return mapping[mem_type]
-
-    else:
+    mapping = _SEGMENT_SELECTORS.get(access_mode)
+    if mapping is None:
         raise ValueError(f"Invalid access mode: {access_mode}. Must be 'word', 'byte', or 'bit'")
+
+    selector = mapping.get(mem_type)
+    if selector is None:
+        raise ValueError(
+            f"Memory type {get_memory_type_name(mem_type)} does not support {access_mode} access"
+        )
+    return selector
@@ -16,7 +16,10 @@ This script tests the basic connection and register reading functionality
 with the PLC at 172.16.12.124.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 import os
 
@@ -25,11 +28,17 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.driver import GE_SRTP_Driver
 
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging (pass --verbose for per-packet driver debug output).
+# Records are written to the console by a listener thread, so the PLC
+# round trips are not held up by console output.
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+logging.root.addHandler(logging.handlers.QueueHandler(_log_queue))
+logging.root.setLevel(logging.DEBUG if '--verbose' in sys.argv else logging.INFO)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Flush queued records on exit
 
 logger = logging.getLogger(__name__)
 
@@ -264,19 +264,16 @@ def main():
     print("="*60)
 
     try:
-        # Connect to PLC
-        plc = GE_SRTP_Driver(plc_ip, slot=cpu_slot)
-        plc.connect()
-        print("\n✓ Connected to PLC")
-
-        # Run all tests
-        test_analog_io(plc)
-        test_discrete_io(plc)
-        test_internal_temp_memory(plc)
-        test_system_memory(plc)
-
-        # Disconnect
-        plc.disconnect()
+        # Connect to PLC; the with block disconnects even if a test raises
+        with GE_SRTP_Driver(plc_ip, slot=cpu_slot) as plc:
+            print("\n✓ Connected to PLC")
+
+            # Run all tests
+            test_analog_io(plc)
+            test_discrete_io(plc)
+            test_internal_temp_memory(plc)
+            test_system_memory(plc)
+
         print("\n" + "="*60)
         print("✓ All tests completed")
         print("="*60)
@@ -14,6 +14,7 @@ Comprehensive memory test for addresses 0-64.
 Tests all memory types with extended address range on clean PLC.
 """
 
+import argparse
 import logging
 import sys
 import os
@@ -56,6 +57,8 @@ class MemoryTester:
             'global_bit': {},
             'global_byte': {}
         }
+        # (successes, errors) of the last run for each memory type
+        self.counts = {memory_type: (0, 0) for memory_type in self.results}
 
     def connect(self):
         """Connect to PLC."""
@@ -70,118 +73,187 @@ class MemoryTester:
             self.plc.disconnect()
             logger.info("Disconnected")
 
-    def test_registers(self, start=0, end=64):
-        """Test register memory (%R) addresses."""
-        print("\n" + "="*80)
-        print(f"TESTING REGISTERS (%R) - Addresses {start} to {end}")
-        print("="*80)
+    def _acquire(self, plan):
+        """
+        Read every region in plan with as few PLC requests as possible.
 
-        success_count = 0
-        error_count = 0
+        If the batched read fails, each region is retried on its own so one
+        bad region does not fail the others.
 
-        for addr in range(start, end + 1):
+        Args:
+            plan: (memory_type, address, count[, mode]) tuples for acquire_all()
+
+        Returns:
+            Dictionary mapping each plan tuple to its values, or to the
+            exception that failed its read
+        """
+        try:
+            return self.plc.acquire_all(plan)
+        except Exception:
+            pass
+
+        data = {}
+        for spec in plan:
             try:
-                value = self.plc.read_register(addr)
-                self.results['registers'][addr] = value
-                print(f"  %R{addr+1} (addr {addr}): {value}")
-                success_count += 1
+                data[spec] = self.plc.acquire_all([spec])[spec]
             except Exception as e:
-                self.results['registers'][addr] = f"ERROR: {str(e)}"
-                print(f"  %R{addr+1} (addr {addr}): ERROR - {e}")
-                error_count += 1
+                data[spec] = e
+        return data
 
-        print(f"\n✓ Success: {success_count}/{end-start+1}")
-        if error_count > 0:
-            print(f"✗ Errors: {error_count}")
-        return success_count, error_count
+    def _acquire_range(self, spec):
+        """
+        Read one address range, falling back to one read per address.
 
-    def test_analog_input(self, start=0, end=64):
-        """Test analog input memory (%AI) addresses."""
-        print("\n" + "="*80)
-        print(f"TESTING ANALOG INPUT (%AI) - Addresses {start} to {end}")
-        print("="*80)
-
-        success_count = 0
-        error_count = 0
+        Args:
+            spec: (memory_type, address, count[, mode]) tuple for acquire_all()
 
-        for addr in range(start, end + 1):
+        Returns:
+            List with the value, or the exception that failed its read,
+            for each address in the range
+        """
+        try:
+            return self.plc.acquire_all([spec])[spec]
+        except Exception:
+            pass
+
+        mem_type, start, count = spec[:3]
+        values = []
+        for addr in range(start, start + count):
+            single = (mem_type, addr, 1) + spec[3:]
             try:
-                value = self.plc.read_analog_input(addr)
-                self.results['analog_input'][addr] = value
-                print(f"  %AI{addr+1} (addr {addr}): {value}")
-                success_count += 1
+                values.append(self.plc.acquire_all([single])[single][0])
             except Exception as e:
-                self.results['analog_input'][addr] = f"ERROR: {str(e)}"
-                print(f"  %AI{addr+1} (addr {addr}): ERROR - {e}")
-                error_count += 1
-
-        print(f"\n✓ Success: {success_count}/{end-start+1}")
-        if error_count > 0:
-            print(f"✗ Errors: {error_count}")
-        return success_count, error_count
-
-    def test_analog_output(self, start=0, end=64):
-        """Test analog output memory (%AQ) addresses."""
+                values.append(e)
+        return values
+
+    @staticmethod
+    def _value(value):
+        """Return a value from _acquire() or _acquire_range(), re-raising its read error."""
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    def _test_word_memory(self, key, title, prefix, start, end):
+        """
+        Test one word memory type (%R, %AI or %AQ) over an address range.
+
+        Args:
+            key: Entry in self.results and self.counts (e.g. 'registers')
+            title: Banner title (e.g. 'REGISTERS')
+            prefix: Memory type prefix (e.g. 'R' for %R)
+            start: First address
+            end: Last address (inclusive)
+
+        Returns:
+            Tuple of (success count, error count)
+        """
         print("\n" + "="*80)
-        print(f"TESTING ANALOG OUTPUT (%AQ) - Addresses {start} to {end}")
+        print(f"TESTING {title} (%{prefix}) - Addresses {start} to {end}")
         print("="*80)
 
         success_count = 0
         error_count = 0
 
+        spec = (prefix, start, end - start + 1)
+        values = self._acquire_range(spec)
+
+        results = self.results[key]
+        lines = []
         for addr in range(start, end + 1):
             try:
-                value = self.plc.read_analog_output(addr)
-                self.results['analog_output'][addr] = value
-                print(f"  %AQ{addr+1} (addr {addr}): {value}")
+                value = self._value(values[addr - start])
+                results[addr] = value
+                lines.append(f"  %{prefix}{addr+1} (addr {addr}): {value}")
                 success_count += 1
             except Exception as e:
-                self.results['analog_output'][addr] = f"ERROR: {str(e)}"
-                print(f"  %AQ{addr+1} (addr {addr}): ERROR - {e}")
+                results[addr] = f"ERROR: {str(e)}"
+                lines.append(f"  %{prefix}{addr+1} (addr {addr}): ERROR - {e}")
                 error_count += 1
+        sys.stdout.write("\n".join(lines) + "\n")
+        self.counts[key] = (success_count, error_count)
 
         print(f"\n✓ Success: {success_count}/{end-start+1}")
         if error_count > 0:
             print(f"✗ Errors: {error_count}")
         return success_count, error_count
 
-    def test_discrete_input(self, start=0, end=64):
-        """Test discrete input memory (%I) in both bit and byte modes."""
+    def test_registers(self, start=0, end=64):
+        """Test register memory (%R) addresses."""
+        return self._test_word_memory('registers', 'REGISTERS', 'R', start, end)
+
+    def test_analog_input(self, start=0, end=64):
+        """Test analog input memory (%AI) addresses."""
+        return self._test_word_memory('analog_input', 'ANALOG INPUT', 'AI', start, end)
+
+    def test_analog_output(self, start=0, end=64):
+        """Test analog output memory (%AQ) addresses."""
+        return self._test_word_memory('analog_output', 'ANALOG OUTPUT', 'AQ', start, end)
+
+    def _test_discrete_memory(self, key, title, prefix, start, end):
+        """
+        Test one discrete memory type (%I, %Q or %M) in bit and byte modes.
+
+        Args:
+            key: Prefix of the self.results and self.counts entries
+                (e.g. 'discrete_input' for 'discrete_input_bit'/'_byte')
+            title: Banner title (e.g. 'DISCRETE INPUT')
+            prefix: Memory type prefix (e.g. 'I' for %I)
+            start: First address
+            end: Last address (inclusive)
+
+        Returns:
+            Tuple of (success count, error count) over both modes
+        """
         print("\n" + "="*80)
-        print(f"TESTING DISCRETE INPUT (%I) - Addresses {start} to {end}")
+        print(f"TESTING {title} (%{prefix}) - Addresses {start} to {end}")
         print("="*80)
 
+        # Read the bit range and the byte windows separately, so a bad byte
+        # window cannot fail the bit-mode addresses
+        bit_spec = (prefix, start, end - start + 1, 'bit')
+        bit_values = self._acquire_range(bit_spec)
+        byte_addrs = range(start, min(end + 1, 16))  # Limit byte test to first 16
+        windows = self._acquire([(prefix, addr, 8, 'byte') for addr in byte_addrs])
+
         # Test bit mode
         print("\n--- Bit Mode ---")
         success_bit = 0
         error_bit = 0
 
+        results = self.results[f'{key}_bit']
+        lines = []
         for addr in range(start, end + 1):
             try:
-                value = self.plc.read_discrete_input(addr, mode='bit')
-                self.results['discrete_input_bit'][addr] = value
-                print(f"  %I{addr+1} (addr {addr}): {value}")
+                value = self._value(bit_values[addr - start])
+                results[addr] = value
+                lines.append(f"  %{prefix}{addr+1} (addr {addr}): {value}")
                 success_bit += 1
             except Exception as e:
-                self.results['discrete_input_bit'][addr] = f"ERROR: {str(e)}"
-                print(f"  %I{addr+1} (addr {addr}): ERROR - {e}")
+                results[addr] = f"ERROR: {str(e)}"
+                lines.append(f"  %{prefix}{addr+1} (addr {addr}): ERROR - {e}")
                 error_bit += 1
+        sys.stdout.write("\n".join(lines) + "\n")
+        self.counts[f'{key}_bit'] = (success_bit, error_bit)
 
         # Test byte mode
         print("\n--- Byte Mode ---")
         success_byte = 0
         error_byte = 0
 
-        for addr in range(start, min(end + 1, 16)):  # Limit byte test to first 16
+        results = self.results[f'{key}_byte']
+        lines = []
+        for addr in byte_addrs:
             try:
-                value = self.plc.read_discrete_input(addr, count=8, mode='byte')
-                self.results['discrete_input_byte'][addr] = value
-                print(f"  %I bytes starting at {addr}: {[hex(v) for v in value]}")
+                value = self._value(windows[(prefix, addr, 8, 'byte')])
+                results[addr] = value
+                lines.append(f"  %{prefix} bytes starting at {addr}: {bytes(value).hex(' ')}")
                 success_byte += 1
             except Exception as e:
-                self.results['discrete_input_byte'][addr] = f"ERROR: {str(e)}"
-                print(f"  %I bytes starting at {addr}: ERROR - {e}")
+                results[addr] = f"ERROR: {str(e)}"
+                lines.append(f"  %{prefix} bytes starting at {addr}: ERROR - {e}")
                 error_byte += 1
+        sys.stdout.write("\n".join(lines) + "\n")
+        self.counts[f'{key}_byte'] = (success_byte, error_byte)
 
         print(f"\n✓ Bit mode success: {success_bit}/{end-start+1}")
         print(f"✓ Byte mode success: {success_byte}/16")
@@ -189,93 +261,17 @@ class MemoryTester:
             print(f"✗ Total errors: {error_bit + error_byte}")
         return success_bit + success_byte, error_bit + error_byte
 
+    def test_discrete_input(self, start=0, end=64):
+        """Test discrete input memory (%I) in both bit and byte modes."""
+        return self._test_discrete_memory('discrete_input', 'DISCRETE INPUT', 'I', start, end)
+
     def test_discrete_output(self, start=0, end=64):
         """Test discrete output memory (%Q) in both bit and byte modes."""
-        print("\n" + "="*80)
-        print(f"TESTING DISCRETE OUTPUT (%Q) - Addresses {start} to {end}")
-        print("="*80)
-
-        # Test bit mode
-        print("\n--- Bit Mode ---")
-        success_bit = 0
-        error_bit = 0
-
-        for addr in range(start, end + 1):
-            try:
-                value = self.plc.read_discrete_output(addr, mode='bit')
-                self.results['discrete_output_bit'][addr] = value
-                print(f"  %Q{addr+1} (addr {addr}): {value}")
-                success_bit += 1
-            except Exception as e:
-                self.results['discrete_output_bit'][addr] = f"ERROR: {str(e)}"
-                print(f"  %Q{addr+1} (addr {addr}): ERROR - {e}")
-                error_bit += 1
-
-        # Test byte mode
-        print("\n--- Byte Mode ---")
-        success_byte = 0
-        error_byte = 0
-
-        for addr in range(start, min(end + 1, 16)):  # Limit byte test to first 16
-            try:
-                value = self.plc.read_discrete_output(addr, count=8, mode='byte')
-                self.results['discrete_output_byte'][addr] = value
-                print(f"  %Q bytes starting at {addr}: {[hex(v) for v in value]}")
-                success_byte += 1
-            except Exception as e:
-                self.results['discrete_output_byte'][addr] = f"ERROR: {str(e)}"
-                print(f"  %Q bytes starting at {addr}: ERROR - {e}")
-                error_byte += 1
-
-        print(f"\n✓ Bit mode success: {success_bit}/{end-start+1}")
-        print(f"✓ Byte mode success: {success_byte}/16")
-        if error_bit > 0 or error_byte > 0:
-            print(f"✗ Total errors: {error_bit + error_byte}")
-        return success_bit + success_byte, error_bit + error_byte
+        return self._test_discrete_memory('discrete_output', 'DISCRETE OUTPUT', 'Q', start, end)
 
     def test_internal_memory(self, start=0, end=64):
         """Test internal memory (%M) in both bit and byte modes."""
-        print("\n" + "="*80)
-        print(f"TESTING INTERNAL MEMORY (%M) - Addresses {start} to {end}")
-        print("="*80)
-
-        # Test bit mode
-        print("\n--- Bit Mode ---")
-        success_bit = 0
-        error_bit = 0
-
-        for addr in range(start, end + 1):
-            try:
-                value = self.plc.read_discrete_internal(addr, mode='bit')
-                self.results['internal_bit'][addr] = value
-                print(f"  %M{addr+1} (addr {addr}): {value}")
-                success_bit += 1
-            except Exception as e:
-                self.results['internal_bit'][addr] = f"ERROR: {str(e)}"
-                print(f"  %M{addr+1} (addr {addr}): ERROR - {e}")
-                error_bit += 1
-
-        # Test byte mode
-        print("\n--- Byte Mode ---")
-        success_byte = 0
-        error_byte = 0
-
-        for addr in range(start, min(end + 1, 16)):  # Limit byte test to first 16
-            try:
-                value = self.plc.read_discrete_internal(addr, count=8, mode='byte')
-                self.results['internal_byte'][addr] = value
-                print(f"  %M bytes starting at {addr}: {[hex(v) for v in value]}")
-                success_byte += 1
-            except Exception as e:
-                self.results['internal_byte'][addr] = f"ERROR: {str(e)}"
-                print(f"  %M bytes starting at {addr}: ERROR - {e}")
-                error_byte += 1
-
-        print(f"\n✓ Bit mode success: {success_bit}/{end-start+1}")
-        print(f"✓ Byte mode success: {success_byte}/16")
-        if error_bit > 0 or error_byte > 0:
-            print(f"✗ Total errors: {error_bit + error_byte}")
-        return success_bit + success_byte, error_bit + error_byte
+        return self._test_discrete_memory('internal', 'INTERNAL MEMORY', 'M', start, end)
 
     def test_plc_diagnostics(self):
         """Test PLC diagnostic functions."""
@@ -316,10 +312,9 @@ class MemoryTester:
         total_tests = 0
         total_success = 0
 
-        for memory_type, data in self.results.items():
-            if data:
-                success = len([v for v in data.values() if not isinstance(v, str) or not v.startswith('ERROR')])
-                total = len(data)
+        for memory_type, (success, errors) in self.counts.items():
+            total = success + errors
+            if total:
                 total_tests += total
                 total_success += success
                 status = "✓" if success == total else "⚠"
@@ -331,11 +326,40 @@ class MemoryTester:
         print(f"{'='*80}")
 
 
+# Memory type tests selectable with --types, in run order
+MEMORY_TESTS = (
+    'registers',
+    'analog_input',
+    'analog_output',
+    'discrete_input',
+    'discrete_output',
+    'internal_memory',
+)
+
+
 def main():
     """Run comprehensive memory tests."""
     PLC_IP = "172.16.12.124"
     CPU_SLOT = 0  # EPXCPE210 in slot 0
 
+    parser = argparse.ArgumentParser(description="Comprehensive memory test for addresses 0-64.")
+    parser.add_argument(
+        '--types',
+        default=','.join(MEMORY_TESTS),
+        help=f"Comma-separated memory types to test: {', '.join(MEMORY_TESTS)} (default: all)"
+    )
+    parser.add_argument(
+        '--skip-diagnostics',
+        action='store_true',
+        help="Skip the PLC diagnostic queries"
+    )
+    args = parser.parse_args()
+
+    types = [name.strip() for name in args.types.split(',') if name.strip()]
+    unknown = [name for name in types if name not in MEMORY_TESTS]
+    if unknown:
+        parser.error(f"unknown memory type(s): {', '.join(unknown)}")
+
     print("="*80)
     print("COMPREHENSIVE MEMORY TEST - Addresses 0-64")
     print("="*80)
@@ -351,15 +375,13 @@ def main():
         tester.connect()
 
         # Run diagnostic tests first
-        tester.test_plc_diagnostics()
-
-        # Test all memory types
-        tester.test_registers(0, 64)
-        tester.test_analog_input(0, 64)
-        tester.test_analog_output(0, 64)
-        tester.test_discrete_input(0, 64)
-        tester.test_discrete_output(0, 64)
-        tester.test_internal_memory(0, 64)
+        if not args.skip_diagnostics:
+            tester.test_plc_diagnostics()
+
+        # Test the selected memory types
+        for name in MEMORY_TESTS:
+            if name in types:
+                getattr(tester, f'test_{name}')(0, 64)
 
         # Print summary
         tester.print_summary()
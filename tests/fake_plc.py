@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+gesrtp-py - GE-SRTP PLC Driver
+Copyright (c) 2025 Jobe Eli Eastwood
+Houston, TX
+
+Author: Jobe Eli Eastwood <jobeastwood@hotmail.com>
+Project: https://github.com/jobeastwood/gesrtp-py
+License: MIT
+
+---
+
+In-process fake PLC for the unittest regression tests.
+
+Answers the initialization packet and every read request with zeros, so
+tests can run without hardware. Reads at chosen addresses can be made to
+fail with a PLC error code or to answer late.
+"""
+
+import socket
+import struct
+import threading
+from typing import Dict, Optional
+
+HEADER_SIZE = 56
+
+
+def _recv_exactly(conn: socket.socket, size: int) -> bytes:
+    """Receive exactly size bytes, or b'' if the client disconnected."""
+    data = b''
+    while len(data) < size:
+        try:
+            chunk = conn.recv(size - len(data))
+        except OSError:
+            return b''
+        if not chunk:
+            return b''
+        data += chunk
+    return data
+
+
+class FakePLC:
+    """
+    Fake PLC listening on a free port of 127.0.0.1.
+
+    Example:
+        ```python
+        plc = FakePLC(errors={999: 0x04}, delays={100: 1.5})
+        driver = GE_SRTP_Driver('127.0.0.1', port=plc.port)
+        ...
+        plc.close()
+        ```
+    """
+
+    def __init__(
+        self,
+        errors: Optional[Dict[int, int]] = None,
+        delays: Optional[Dict[int, float]] = None
+    ):
+        """
+        Start listening.
+
+        Args:
+            errors: Read offset -> PLC error code to answer with a NACK
+            delays: Read offset -> seconds to wait before answering
+        """
+        self.errors = errors or {}
+        self.delays = delays or {}
+
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.bind(('127.0.0.1', 0))
+        self.server.listen(8)
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    @property
+    def port(self) -> int:
+        """TCP port the fake PLC listens on."""
+        return self.server.getsockname()[1]
+
+    def close(self) -> None:
+        """Stop accepting connections."""
+        self.server.close()
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve_client, args=(conn,), daemon=True).start()
+
+    def _serve_client(self, conn: socket.socket) -> None:
+        """Answer the init packet, then every read request, until disconnected."""
+        send_lock = threading.Lock()
+
+        def send(data: bytes) -> None:
+            with send_lock:
+                try:
+                    conn.sendall(data)
+                except OSError:
+                    pass
+
+        with conn:
+            if not _recv_exactly(conn, HEADER_SIZE):
+                return
+            init_response = bytearray(HEADER_SIZE)
+            init_response[0] = 0x01
+            send(bytes(init_response))
+
+            while True:
+                request = _recv_exactly(conn, HEADER_SIZE)
+                if not request:
+                    return
+                offset, length = struct.unpack_from('<HH', request, 44)
+                response = self._build_response(request, offset, length)
+
+                delay = self.delays.get(offset)
+                if delay:
+                    timer = threading.Timer(delay, send, args=(response,))
+                    timer.daemon = True
+                    timer.start()
+                else:
+                    send(response)
+
+    def _build_response(self, request: bytes, offset: int, length: int) -> bytes:
+        """Build the ACK (zeros) or NACK response to one read request."""
+        seq = request[2]
+        if offset in self.errors:
+            message_type, payload = 0xD1, bytes([self.errors[offset]])
+        else:
+            message_type, payload = 0x94, bytes(2 * length)
+
+        response = bytearray(HEADER_SIZE)
+        response[0] = 0x03
+        response[2] = seq
+        response[4] = len(payload)
+        response[30] = seq
+        response[31] = message_type
+        response[42:44] = request[42:44]
+        struct.pack_into('<HH', response, 44, offset, length)
+        return bytes(response) + payload
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+gesrtp-py - GE-SRTP PLC Driver
+Copyright (c) 2025 Jobe Eli Eastwood
+Houston, TX
+
+Author: Jobe Eli Eastwood <jobeastwood@hotmail.com>
+Project: https://github.com/jobeastwood/gesrtp-py
+License: MIT
+
+---
+
+Tests for AsyncSRTPConnection request matching.
+
+Runs against the in-process fake PLC in fake_plc.py, so no hardware is
+needed. Delayed addresses make the fake PLC answer out of order, late,
+or not before the connection is closed.
+"""
+
+import asyncio
+import sys
+import os
+import unittest
+
+# Add parent directory to path so we can import src module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.async_connection import AsyncSRTPConnection
+from src.packet import SRTPPacket
+from src import protocol
+from src import exceptions
+from tests.fake_plc import FakePLC
+
+SLOW_ADDRESS = 0     # Answered after 0.2 s
+LATE_ADDRESS = 200   # Answered after 1 s, past the 0.5 s timeout
+HUNG_ADDRESS = 300   # Answered after 5 s, after the test disconnects
+
+
+class AsyncConnectionTest(unittest.IsolatedAsyncioTestCase):
+    """Responses must reach the request with the same sequence number."""
+
+    async def asyncSetUp(self):
+        self.fake_plc = FakePLC(delays={SLOW_ADDRESS: 0.2, LATE_ADDRESS: 1.0, HUNG_ADDRESS: 5.0})
+        self.addCleanup(self.fake_plc.close)
+        self.conn = AsyncSRTPConnection('127.0.0.1', port=self.fake_plc.port, timeout=0.5)
+        await self.conn.connect()
+
+    async def asyncTearDown(self):
+        await self.conn.disconnect()
+
+    def build_read(self, offset):
+        return SRTPPacket.build_request(
+            self.conn.next_sequence_number(),
+            protocol.ServiceCode.READ_SYSTEM_MEMORY,
+            protocol.SegmentSelector.REGISTERS_WORD,
+            offset, 4, slot=0
+        )
+
+    async def test_concurrent_requests_matched_out_of_order(self):
+        completed = []
+
+        async def read(offset):
+            response = await self.conn.request(self.build_read(offset))
+            completed.append(offset)
+            return response
+
+        slow, fast = await asyncio.gather(read(SLOW_ADDRESS), read(4))
+
+        # The second request was answered first, yet each got its own response
+        self.assertEqual(completed, [4, SLOW_ADDRESS])
+        self.assertEqual(slow.data_offset, SLOW_ADDRESS)
+        self.assertEqual(fast.data_offset, 4)
+
+    async def test_late_response_discarded_after_timeout(self):
+        with self.assertRaises(exceptions.TimeoutError):
+            await self.conn.request(self.build_read(LATE_ADDRESS))
+
+        with self.assertLogs('src.async_connection', 'WARNING'):
+            await asyncio.sleep(0.8)
+
+        response = await self.conn.request(self.build_read(8))
+        self.assertEqual(response.data_offset, 8)
+
+    async def test_disconnect_fails_outstanding_requests(self):
+        task = asyncio.create_task(self.conn.request(self.build_read(HUNG_ADDRESS)))
+        await asyncio.sleep(0.1)
+
+        await self.conn.disconnect()
+
+        with self.assertRaisesRegex(exceptions.ConnectionError, "Connection closed"):
+            await task
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+gesrtp-py - GE-SRTP PLC Driver
+Copyright (c) 2025 Jobe Eli Eastwood
+Houston, TX
+
+Author: Jobe Eli Eastwood <jobeastwood@hotmail.com>
+Project: https://github.com/jobeastwood/gesrtp-py
+License: MIT
+
+---
+
+Regression test for pipelined reads that hit a PLC error (NACK).
+
+Runs against the in-process fake PLC in fake_plc.py, so no hardware is
+needed. The fake PLC rejects every read at address 999 with a PLC error
+code and answers all other reads with zeros.
+"""
+
+import sys
+import os
+import unittest
+
+# Add parent directory to path so we can import src module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.driver import GE_SRTP_Driver
+from src import exceptions
+from tests.fake_plc import FakePLC
+
+BAD_ADDRESS = 999
+
+
+class PipelineNackTest(unittest.TestCase):
+    """A NACK inside a pipelined window must not desync the connection."""
+
+    def start(self, error_code):
+        self.fake_plc = FakePLC(errors={BAD_ADDRESS: error_code})
+        self.addCleanup(self.fake_plc.close)
+        self.plc = GE_SRTP_Driver('127.0.0.1', port=self.fake_plc.port, timeout=2)
+        self.plc.connect()
+        self.addCleanup(self.plc.disconnect)
+
+    def assert_in_sync(self):
+        # Later reads get their own responses, not leftovers of the window
+        self.assertEqual(self.plc.read_register(0, 3), [0, 0, 0])
+        self.assertEqual(
+            self.plc.read_batch([('R', 0, 2), ('AQ', 0, 2)]),
+            [[0, 0], [0, 0]]
+        )
+
+    def test_nack_mid_window_keeps_connection_in_sync(self):
+        self.start(0x01)
+        with self.assertRaises(exceptions.ServiceCodeError):
+            self.plc.read_batch([('R', 0, 3), ('R', BAD_ADDRESS, 3), ('AI', 0, 2)])
+        self.assert_in_sync()
+
+    def test_plc_timeout_code_mid_window_keeps_connection_in_sync(self):
+        # Error code 0x08 maps to TimeoutError, a ConnectionError subclass,
+        # but it is still a reply from the PLC and the window must be drained
+        self.start(0x08)
+        with self.assertRaises(exceptions.TimeoutError):
+            self.plc.read_batch([('R', 0, 3), ('R', BAD_ADDRESS, 3), ('AI', 0, 2)])
+        self.assertTrue(self.plc.connection.is_connected)
+        self.assert_in_sync()
+
+if __name__ == "__main__":
+    unittest.main()
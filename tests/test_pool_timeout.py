@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+gesrtp-py - GE-SRTP PLC Driver
+Copyright (c) 2025 Jobe Eli Eastwood
+Houston, TX
+
+Author: Jobe Eli Eastwood <jobeastwood@hotmail.com>
+Project: https://github.com/jobeastwood/gesrtp-py
+License: MIT
+
+---
+
+Regression test for pooled connections whose read timed out.
+
+Runs against the in-process fake PLC in fake_plc.py, so no hardware is
+needed. The fake PLC answers reads at address 100 only after 1.5 seconds,
+past the pool's 1 second timeout.
+"""
+
+import sys
+import os
+import time
+import unittest
+
+# Add parent directory to path so we can import src module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.driver import GE_SRTP_Driver
+from src.pool import SRTPConnectionPool
+from src import exceptions
+from tests.fake_plc import FakePLC
+
+SLOW_ADDRESS = 100
+
+
+class PoolTimeoutTest(unittest.TestCase):
+    """A timed-out connection must not carry its late response to the next session."""
+
+    def setUp(self):
+        self.fake_plc = FakePLC(delays={SLOW_ADDRESS: 1.5})
+        self.addCleanup(self.fake_plc.close)
+        self.pool = SRTPConnectionPool(timeout=1)
+        self.addCleanup(self.pool.close)
+
+    def test_next_session_after_timeout_gets_its_own_response(self):
+        with GE_SRTP_Driver('127.0.0.1', port=self.fake_plc.port, pool=self.pool) as plc:
+            with self.assertRaises(exceptions.TimeoutError):
+                plc.read_register(SLOW_ADDRESS)
+
+        # Let the late response arrive before the next session reads
+        time.sleep(1)
+
+        with GE_SRTP_Driver('127.0.0.1', port=self.fake_plc.port, pool=self.pool) as plc:
+            self.assertEqual(plc.read_register(0, 2), [0, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()